@@ -0,0 +1,32 @@
+"""Index user.name, jobs.posted_date and job_matches (user_id, match_score).
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: Union[str, None] = "f7a8b9c0d1e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_name", "user", ["name"])
+    op.create_index("ix_jobs_posted_date", "jobs", ["posted_date"])
+    op.create_index(
+        "ix_job_matches_user_id_match_score",
+        "job_matches",
+        ["user_id", "match_score"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_matches_user_id_match_score", table_name="job_matches")
+    op.drop_index("ix_jobs_posted_date", table_name="jobs")
+    op.drop_index("ix_user_name", table_name="user")
@@ -0,0 +1,24 @@
+"""Add composite (source, source_job_id) index to jobs table.
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_source_source_job_id", "jobs", ["source", "source_job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_source_source_job_id", table_name="jobs")
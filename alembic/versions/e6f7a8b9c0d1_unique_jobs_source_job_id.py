@@ -0,0 +1,56 @@
+"""Make the (source, source_job_id) index on jobs unique.
+
+Scrapers insert with ON CONFLICT DO NOTHING against this index. Duplicate
+rows left over from before it existed are merged into the oldest copy first:
+applications are re-pointed and the duplicates' match scores dropped.
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_KEEP_ID = """
+    SELECT MIN(k.id) FROM jobs k
+    WHERE k.source = d.source AND k.source_job_id = d.source_job_id
+"""
+
+_DUPLICATE_IDS = f"""
+    SELECT d.id FROM jobs d
+    WHERE d.source_job_id IS NOT NULL AND d.id > ({_KEEP_ID})
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        UPDATE applications SET job_id = (
+            SELECT ({_KEEP_ID}) FROM jobs d WHERE d.id = applications.job_id
+        )
+        WHERE job_id IN ({_DUPLICATE_IDS})
+        """
+    )
+    op.execute(f"DELETE FROM job_matches WHERE job_id IN ({_DUPLICATE_IDS})")
+    op.execute(f"DELETE FROM jobs WHERE id IN ({_DUPLICATE_IDS})")
+
+    op.drop_index("ix_jobs_source_source_job_id", table_name="jobs")
+    op.create_index(
+        "ix_jobs_source_source_job_id",
+        "jobs",
+        ["source", "source_job_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_source_source_job_id", table_name="jobs")
+    op.create_index("ix_jobs_source_source_job_id", "jobs", ["source", "source_job_id"])
@@ -0,0 +1,48 @@
+"""Give jobs.scraped_at a server-side default.
+
+Rows inserted with raw SQL (migrations, manual fixes) and no scraped_at are
+stamped by the database instead of being left NULL, which would hide them
+from the expiry sweep. The default is UTC on every backend, to match the
+datetime.utcnow() values the application writes and compares against:
+PostgreSQL's now() follows the session TimeZone, so it is converted first.
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: Union[str, None] = "e6f7a8b9c0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        default = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    else:
+        # SQLite's CURRENT_TIMESTAMP is already UTC
+        default = sa.text("(CURRENT_TIMESTAMP)")
+    # batch mode so SQLite (which can't ALTER COLUMN) rebuilds the table.
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.alter_column(
+            "scraped_at",
+            existing_type=sa.DateTime(),
+            server_default=default,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.alter_column(
+            "scraped_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
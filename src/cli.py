@@ -6,34 +6,48 @@ from typing import List, Optional
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    MofNCompleteColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from rich.table import Table
 
-from src import s3_sync
 from src.application_tracker import ApplicationTracker
 from src.data_exporter import DataExporter
 from src.database import get_session, init_db
-from src.job_matcher import compute_match_for_user
+from src.job_matcher import USER_MATCH_OPTIONS, compute_match_for_user
 from src.job_scrapers.registry import DEFAULT_SOURCES, SCRAPER_MAP
 from src.job_searcher import JobSearcher
 from src.metrics import get_metrics_summary
 from src.models import Job, User
-from src.prometheus_exporter import create_exporter
 from src.user_profile import UserProfile
-from src.worker import setup_signal_handlers, start_worker
+
+# s3_sync (boto3), worker (apscheduler), prometheus_exporter and rich.progress
+# are imported inside the commands that need them, so `--help` and read-only
+# commands don't pay for them at startup.
 
 console = Console()
 
 
+class CommaSeparatedList(click.ParamType):
+    """Click type that splits "a, b,c" into ["a", "b", "c"], dropping blanks."""
+
+    name = "list"
+
+    def convert(self, value, param, ctx) -> List[str]:
+        if isinstance(value, list):
+            return value
+        return [part.strip() for part in str(value).split(",") if part.strip()]
+
+
+COMMA_LIST = CommaSeparatedList()
+
+
+def _flatten_lists(ctx, param, value) -> List[str]:
+    """Option callback merging repeated COMMA_LIST values into one list."""
+    return [item for items in value or () for item in items]
+
+
 def _sync_pull() -> None:
     """Pull DB from S3 before a mutation (no-op when S3_BUCKET is not set)."""
+    from src import s3_sync
+
     if s3_sync.is_configured():
         console.print("[dim]↓ Syncing from S3...[/dim]")
         s3_sync.pull()
@@ -41,6 +55,8 @@ def _sync_pull() -> None:
 
 def _sync_push() -> None:
     """Push DB to S3 after a successful mutation (no-op when S3_BUCKET is not set)."""
+    from src import s3_sync
+
     if s3_sync.is_configured():
         console.print("[dim]↑ Syncing to S3...[/dim]")
         s3_sync.push()
@@ -72,6 +88,8 @@ def db() -> None:
 @db.command("pull")
 def db_pull() -> None:
     """Download the DB from S3, replacing the local copy."""
+    from src import s3_sync
+
     if not s3_sync.is_configured():
         console.print("[yellow]S3_BUCKET not set — nothing to pull[/yellow]")
         return
@@ -85,6 +103,8 @@ def db_pull() -> None:
 @db.command("push")
 def db_push() -> None:
     """Upload the local DB to S3, replacing the remote copy."""
+    from src import s3_sync
+
     if not s3_sync.is_configured():
         console.print("[yellow]S3_BUCKET not set — nothing to push[/yellow]")
         return
@@ -105,19 +125,25 @@ def profile() -> None:
 @click.argument("cv_file", type=click.Path(exists=True))
 @click.option(
     "--titles",
+    type=COMMA_LIST,
     multiple=True,
+    callback=_flatten_lists,
     prompt=False,
     help="Target job titles (comma-separated)",
 )
 @click.option(
     "--industries",
+    type=COMMA_LIST,
     multiple=True,
+    callback=_flatten_lists,
     prompt=False,
     help="Target industries (comma-separated)",
 )
 @click.option(
     "--locations",
+    type=COMMA_LIST,
     multiple=True,
+    callback=_flatten_lists,
     prompt=False,
     help="Preferred job locations (comma-separated)",
 )
@@ -147,7 +173,9 @@ def profile() -> None:
 )
 @click.option(
     "--contracts",
+    type=COMMA_LIST,
     multiple=True,
+    callback=_flatten_lists,
     prompt=False,
     help="Contract types (comma-separated)",
 )
@@ -159,14 +187,14 @@ def profile() -> None:
 )
 def upload(
     cv_file: str,
-    titles: tuple,
-    industries: tuple,
-    locations: tuple,
+    titles: List[str],
+    industries: List[str],
+    locations: List[str],
     salary_min: Optional[float],
     salary_max: Optional[float],
     experience: Optional[str],
     remote: Optional[str],
-    contracts: tuple,
+    contracts: List[str],
     interactive: bool,
 ) -> None:
     """Upload and parse CV file.
@@ -194,11 +222,10 @@ def upload(
                 ),
             ) = _prompt_preferences()
 
-        # Convert tuples to lists and handle comma-separated values
-        target_titles = _parse_list_input(titles)
-        target_industries = _parse_list_input(industries)
-        preferred_locations = _parse_list_input(locations)
-        contract_types = _parse_list_input(contracts)
+        target_titles = list(titles)
+        target_industries = list(industries)
+        preferred_locations = list(locations)
+        contract_types = list(contracts)
 
         # Create profile
         user = profile_manager.create_profile_from_cv(
@@ -518,23 +545,6 @@ def _prompt_preferences() -> tuple:
     )
 
 
-def _parse_list_input(items: tuple) -> List[str]:
-    """Parse list input from CLI, handling comma-separated values.
-
-    Args:
-        items: Tuple of input items
-
-    Returns:
-        List of parsed items
-    """
-    result: List[str] = []
-    for item in items:
-        # Handle comma-separated values
-        parts = item.split(",")
-        result.extend(p.strip() for p in parts if p.strip())
-    return result
-
-
 @cli.command()
 @click.option(
     "--user-id",
@@ -555,10 +565,10 @@ def match(user_id: Optional[int], min_score: float) -> None:
 
     try:
         # Load users and optionally filter
+        query = session.query(User).options(*USER_MATCH_OPTIONS)
         if user_id:
-            users = session.query(User).filter(User.id == user_id).all()
-        else:
-            users = session.query(User).all()
+            query = query.filter(User.id == user_id)
+        users = query.all()
 
         if not users:
             console.print("[yellow]No users found to match[/yellow]")
@@ -573,6 +583,15 @@ def match(user_id: Optional[int], min_score: float) -> None:
         accepted = 0
         total = len(users) * len(jobs)
 
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -651,6 +670,8 @@ def scrape(sources: tuple, keywords: tuple, max_retries: int, backoff: float) ->
 
             except Exception as e:
                 console.print(f"[red]✗[/red] Error scraping {src_name}: {e}")
+            finally:
+                scraper.close()
 
         console.print(
             f"[green]✓[/green] Scraping completed. Total new jobs: {total_new}"
@@ -685,6 +706,8 @@ def worker(scrape_cron: str, match_cron: str) -> None:
             f"  Match schedule: {match_cron}"
         )
 
+        from src.worker import setup_signal_handlers, start_worker
+
         scheduler = start_worker(
             scrape_cron=scrape_cron,
             match_cron=match_cron,
@@ -762,6 +785,8 @@ def prometheus(port: int) -> None:
     try:
         from prometheus_client import start_http_server
 
+        from src.prometheus_exporter import create_exporter
+
         # Create and register collector
         create_exporter()
 
@@ -1,7 +1,63 @@
 """CV parsing module for extracting structured data from CV markdown."""
 
 import re
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Patterns are compiled once at import time rather than looked up in re's
+# internal cache on every call.
+# Email, "**Location**:", "**Title**:" and phone in a single alternation so
+# the CV head is scanned once for all four. Location and title stop at "|"
+# so a one-line "Location | Email | Phone" contact row still yields the rest.
+# Each pattern captures its value in a group named after the field.
+_PERSONAL_INFO_PATTERNS: Dict[str, str] = {
+    "email": r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)",
+    "location": r"\*\*Location\*\*:\s*(?P<location>[^\n|]+)",
+    "title": r"\*\*Title\*\*:\s*(?P<title>[^\n|]+)",
+    "phone": r"(?P<phone>\+?[0-9\s\-\(\)]{10,})",
+}
+_PERSONAL_INFO_RE = re.compile("|".join(_PERSONAL_INFO_PATTERNS.values()))
+# Individual patterns for the full-text search of fields missing from the head
+_PERSONAL_INFO_FIELD_RES = {
+    name: re.compile(pattern) for name, pattern in _PERSONAL_INFO_PATTERNS.items()
+}
+_LABEL_VALUE_RE = re.compile(r":\s*(.+?)$")
+_CITY_COUNTRY_RE = re.compile(r"^[A-ZÄÖÜ][a-zA-ZäöüÄÖÜ\-]+,\s+[A-Z][a-zA-Z]+$")
+_LEADING_BULLET_RE = re.compile(r"^[-*]\s+", re.MULTILINE)
+_BULLET_RE = re.compile(r"[-*]\s+([^\n]+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SKILL_ITEM_SPLIT_RE = re.compile(r"[,\n]+")
+_SUBSECTION_SPLIT_RE = re.compile(r"\n###\s+")
+_ENTRY_SPLIT_RE = re.compile(r"\n### ")
+# "**Location**: X | **Duration**: Y" metadata under an experience or
+# education entry. Labels must start a line or follow "|", so bullets that
+# merely mention "location" are not mistaken for metadata.
+_ENTRY_META_RE = re.compile(
+    r"(?:^|\|)[ \t]*(?:\*\*)?(location|duration|degree)(?:\*\*)?[ \t]*:"
+    r"[ \t]*([^|\n]*[^|\s])",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Contact details usually live at the top of a CV; personal-info lookups scan
+# this many leading characters first and only search the rest on a miss.
+_HEAD_CHARS = 2048
+
+_PLAIN_SKILLS_SECTION_RE = re.compile(
+    r"[Ss]kills?\s*\n(.*?)(?=\n[A-Z][^\n]{0,30}\n|\Z)", re.DOTALL
+)
+# One "## Header" section per match: group 1 is the header, group 2 the body
+# up to the next level-2 header.
+_SECTION_RE = re.compile(
+    r"^##[ \t]+([^\n]+?)[ \t]*\n(.*?)(?=\n##\s|\Z)", re.MULTILINE | re.DOTALL
+)
+# Free-text sections returned by parse(), keyed by output field: the
+# lowercased "## Header" names that hold it, in order of preference.
+_TEXT_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "professional_summary": ("professional summary",),
+    "certifications": ("certifications", "awards & recognition"),
+    "projects": ("projects",),
+}
+_SKILLS_HEADER_RE = re.compile(r"(?:core\s+)?skill")
 
 
 class CVParser:
@@ -11,19 +67,27 @@ class CVParser:
         """Initialize parser with CV text."""
         self.cv_text = cv_text
         self.lines = cv_text.split("\n")
+        self._head = cv_text[:_HEAD_CHARS]
+        self._head_fields: Optional[Dict[str, str]] = None
+        # Lowercased copy of the header lines scanned by the label fallbacks
+        self._head_lines_lc = [line.lower() for line in self.lines[:20]]
+        # Level-2 sections keyed by lowercased header, built in one pass so
+        # section lookups don't rescan the whole document. The first section
+        # wins when a header repeats.
+        self._sections: Dict[str, str] = {}
+        for match in _SECTION_RE.finditer(cv_text):
+            self._sections.setdefault(match.group(1).lower(), match.group(2))
 
     def parse(self) -> Dict:
         """Parse CV and return structured data."""
         return {
             "personal_info": self._parse_personal_info(),
-            "professional_summary": self._parse_section("Professional Summary"),
+            "professional_summary": self._parse_section("professional_summary"),
             "skills": self._parse_skills(),
             "experience": self._parse_experience(),
             "education": self._parse_education(),
-            "certifications": self._parse_section(
-                "Certifications|Awards & Recognition"
-            ),
-            "projects": self._parse_section("Projects"),
+            "certifications": self._parse_section("certifications"),
+            "projects": self._parse_section("projects"),
             "languages": self._parse_languages(),
         }
 
@@ -66,30 +130,51 @@ class CVParser:
                     return stripped
         return None
 
+    def _scan_head(self) -> Dict[str, str]:
+        """Return the first email/phone/location/title match in the CV.
+
+        One finditer pass over the head fills all four fields, stopping early
+        once each has been seen. Any field the head does not contain is then
+        searched for in the full text. The result is cached on the parser.
+        """
+        if self._head_fields is None:
+            fields: Dict[str, str] = {}
+            for match in _PERSONAL_INFO_RE.finditer(self._head):
+                name = match.lastgroup
+                if name and name not in fields:
+                    fields[name] = match.group(name)
+                    if len(fields) == 4:
+                        break
+            if len(fields) < 4 and len(self.cv_text) > _HEAD_CHARS:
+                for name, pattern in _PERSONAL_INFO_FIELD_RES.items():
+                    if name in fields:
+                        continue
+                    match = pattern.search(self.cv_text)
+                    if match:
+                        fields[name] = match.group(name)
+            self._head_fields = fields
+        return self._head_fields
+
     def _extract_email(self) -> Optional[str]:
         """Extract email address."""
-        match = re.search(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", self.cv_text
-        )
-        return match.group(0) if match else None
+        return self._scan_head().get("email")
 
     def _extract_phone(self) -> Optional[str]:
         """Extract phone number."""
-        match = re.search(r"\+?[0-9\s\-\(\)]{10,}", self.cv_text)
-        return match.group(0).strip() if match else None
+        phone = self._scan_head().get("phone")
+        return phone.strip() if phone else None
 
     def _extract_location(self) -> Optional[str]:
         """Extract location from contact section."""
         # Look for "- **Location**:" pattern (Markdown)
-        pattern = r"\*\*Location\*\*:\s*([^\n]+)"
-        match = re.search(pattern, self.cv_text)
-        if match:
-            return match.group(1).strip()
+        location = self._scan_head().get("location")
+        if location:
+            return location.strip()
 
         # Look for "location:" label in first 20 lines
-        for line in self.lines[:20]:
-            if "location" in line.lower():
-                match = re.search(r":\s*(.+?)$", line)
+        for line, line_lc in zip(self.lines, self._head_lines_lc):
+            if "location" in line_lc:
+                match = _LABEL_VALUE_RE.search(line)
                 if match:
                     return match.group(1).strip()
 
@@ -97,34 +182,45 @@ class CVParser:
         # first 10 lines (short line with a comma between two capitalised words)
         for line in self.lines[:10]:
             stripped = line.strip()
-            if re.match(r"^[A-ZÄÖÜ][a-zA-ZäöüÄÖÜ\-]+,\s+[A-Z][a-zA-Z]+$", stripped):
+            if _CITY_COUNTRY_RE.match(stripped):
                 return stripped
         return None
 
     def _extract_title(self) -> Optional[str]:
         """Extract job title/current role."""
         # Look for "- **Title**:" pattern
-        pattern = r"\*\*Title\*\*:\s*([^\n]+)"
-        match = re.search(pattern, self.cv_text)
-        if match:
-            return match.group(1).strip()
+        title = self._scan_head().get("title")
+        if title:
+            return title.strip()
 
         # Fallback: look for "title:" in first 500 chars
-        for line in self.lines[:20]:
-            if "title" in line.lower():
-                match = re.search(r":\s*(.+?)$", line)
+        for line, line_lc in zip(self.lines, self._head_lines_lc):
+            if "title" in line_lc:
+                match = _LABEL_VALUE_RE.search(line)
                 if match:
                     return match.group(1).strip()
         return None
 
-    def _parse_section(self, section_name: str) -> Optional[str]:
-        """Extract text content of a section."""
-        pattern = rf"## {section_name}\n(.*?)(?=\n## |\Z)"
-        match = re.search(pattern, self.cv_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            content = match.group(1).strip()
+    def _find_section(self, keyword: str) -> Optional[str]:
+        """Return the body of the first section whose header contains keyword."""
+        for header, body in self._sections.items():
+            if keyword in header:
+                return body
+        return None
+
+    def _parse_section(self, key: str) -> Optional[str]:
+        """Extract text content of a section.
+
+        key is a _TEXT_SECTIONS entry; the first of its headers present in
+        the CV is used.
+        """
+        for header in _TEXT_SECTIONS[key]:
+            body = self._sections.get(header)
+            if body is None:
+                continue
+            content = body.strip()
             # Remove bullet points and clean up
-            content = re.sub(r"^[-*]\s+", "", content, flags=re.MULTILINE)
+            content = _LEADING_BULLET_RE.sub("", content)
             return content if content else None
         return None
 
@@ -137,38 +233,37 @@ class CVParser:
         }
 
         # Find Core Skills or Skills section
-        pattern = r"## (?:Core\s+)?[Ss]kill[^\n]*\n(.*?)(?=\n## |\Z)"
-        match = re.search(pattern, self.cv_text, re.DOTALL)
+        skills_text = next(
+            (
+                body
+                for header, body in self._sections.items()
+                if _SKILLS_HEADER_RE.match(header)
+            ),
+            None,
+        )
 
-        if not match:
+        if skills_text is None:
             # Fallback: plain-text "Skills" header (e.g. PDF-extracted CVs)
-            plain_pattern = r"[Ss]kills?\s*\n(.*?)(?=\n[A-Z][^\n]{0,30}\n|\Z)"
-            match = re.search(plain_pattern, self.cv_text, re.DOTALL)
+            match = _PLAIN_SKILLS_SECTION_RE.search(self.cv_text)
             if not match:
                 return skills
             raw = match.group(1)
             # Skills are typically comma-separated in plain-text CVs;
             # collapse internal whitespace in case text came from pypdf
             items = [
-                re.sub(r"\s+", " ", s).strip().rstrip(".,")
-                for s in re.split(r"[,\n]+", raw)
+                _WHITESPACE_RE.sub(" ", s).strip().rstrip(".,")
+                for s in _SKILL_ITEM_SPLIT_RE.split(raw)
                 if s.strip() and len(s.strip()) > 2
             ]
             skills["technical"] = items
             return skills
 
-        skills_text = match.group(1)
-
         # Split by subsections (### Technical, ### Professional, etc.)
-        subsections = re.split(r"\n###\s+", skills_text)
+        subsections = _SUBSECTION_SPLIT_RE.split(skills_text)
 
         for subsection in subsections:
-            lines = subsection.split("\n")
-            if not lines:
-                continue
-
             # First line is the category name
-            category_line = lines[0].lower()
+            category_line = subsection.partition("\n")[0].lower()
             if "language" in category_line:
                 category = "languages"
             elif "technical" in category_line:
@@ -177,11 +272,8 @@ class CVParser:
                 category = "soft"
 
             # Extract bullet points from this subsection
-            items = re.findall(r"[-*]\s+([^\n]+)", subsection)
-            for item in items:
-                item_clean = item.strip()
-                if item_clean:
-                    skills[category].append(item_clean)
+            items = map(str.strip, _BULLET_RE.findall(subsection))
+            skills[category].extend(filter(None, items))
 
         return skills
 
@@ -190,23 +282,20 @@ class CVParser:
         experiences: List[Dict[str, Optional[str]]] = []
 
         # Find Professional Experience section header and content
-        pattern = r"##\s+[^\n]*[Ee]xperience[^\n]*\n(.*?)(?=\n##\s|\Z)"
-        match = re.search(pattern, self.cv_text, re.DOTALL)
+        exp_text = self._find_section("experience")
 
-        if not match:
+        if exp_text is None:
             return experiences
 
-        exp_text = match.group(1)
-
         # Split by "###" headers (job titles)
-        job_blocks = re.split(r"\n### ", exp_text)
+        job_blocks = _ENTRY_SPLIT_RE.split(exp_text)
 
         for block in job_blocks:
             if not block.strip():
                 continue
 
-            lines = block.split("\n")
-            header = lines[0].strip()
+            header, _, body = block.partition("\n")
+            header = header.strip()
 
             exp_dict: Dict[str, Optional[str]] = {
                 "title": None,
@@ -229,13 +318,10 @@ class CVParser:
                 exp_dict["company"] = header
 
             # Parse metadata
-            for line in lines[1:]:
-                if "Location" in line or "location" in line:
-                    location = re.sub(r"\*\*Location\*\*:\s*", "", line)
-                    exp_dict["location"] = location.strip() or exp_dict.get("location")
-                elif "Duration" in line or "duration" in line:
-                    duration = re.sub(r"\*\*Duration\*\*:\s*", "", line)
-                    exp_dict["duration"] = duration.strip() or exp_dict.get("duration")
+            for label, value in _ENTRY_META_RE.findall(body):
+                label = label.lower()
+                if label != "degree" and not exp_dict[label]:
+                    exp_dict[label] = value
 
             if exp_dict["company"]:
                 experiences.append(exp_dict)
@@ -247,23 +333,20 @@ class CVParser:
         education: List[Dict[str, Optional[str]]] = []
 
         # Find Education section header and content
-        pattern = r"##\s+[^\n]*[Ee]ducation[^\n]*\n(.*?)(?=\n##\s|\Z)"
-        match = re.search(pattern, self.cv_text, re.DOTALL)
+        edu_text = self._find_section("education")
 
-        if not match:
+        if edu_text is None:
             return education
 
-        edu_text = match.group(1)
-
         # Split by "###" headers (schools)
-        edu_blocks = re.split(r"\n### ", edu_text)
+        edu_blocks = _ENTRY_SPLIT_RE.split(edu_text)
 
         for block in edu_blocks:
             if not block.strip():
                 continue
 
-            lines = block.split("\n")
-            header = lines[0].strip()
+            header, _, body = block.partition("\n")
+            header = header.strip()
 
             edu_dict: Dict[str, Optional[str]] = {
                 "school": None,
@@ -276,16 +359,10 @@ class CVParser:
             edu_dict["school"] = header
 
             # Parse metadata
-            for line in lines[1:]:
-                if "Location" in line or "location" in line:
-                    location = re.sub(r"\*\*Location\*\*:\s*", "", line)
-                    edu_dict["location"] = location.strip() or edu_dict.get("location")
-                elif "Duration" in line or "duration" in line:
-                    duration = re.sub(r"\*\*Duration\*\*:\s*", "", line)
-                    edu_dict["duration"] = duration.strip() or edu_dict.get("duration")
-                elif "Degree" in line or "degree" in line:
-                    degree = re.sub(r"\*\*Degree\*\*:\s*", "", line)
-                    edu_dict["degree"] = degree.strip() or edu_dict.get("degree")
+            for label, value in _ENTRY_META_RE.findall(body):
+                label = label.lower()
+                if not edu_dict[label]:
+                    edu_dict[label] = value
 
             if edu_dict["school"]:
                 education.append(edu_dict)
@@ -297,27 +374,30 @@ class CVParser:
         languages = []
 
         # Look for Languages section or extract from skills
-        pattern = r"## [^\n]*[Ll]anguages[^\n]*\n(.*?)(?=\n## |\Z)"
-        match = re.search(pattern, self.cv_text, re.DOTALL)
+        lang_text = self._find_section("languages")
 
-        if match:
-            lang_text = match.group(1)
-            items = re.findall(r"[-*]\s+([^\n]+)", lang_text)
-            languages.extend([item.strip() for item in items])
+        if lang_text is not None:
+            languages.extend(map(str.strip, _BULLET_RE.findall(lang_text)))
+        else:
+            languages.extend(self._parse_skills()["languages"])
 
         return languages
 
 
+def parse_cv_text(cv_text: str) -> Dict[str, Any]:
+    """Parse CV from markdown text already in memory."""
+    try:
+        return CVParser(cv_text).parse()
+    except Exception as e:
+        print(f"✗ Error parsing CV: {e}")
+        return {}
+
+
 def parse_cv_file(file_path: str) -> Dict[str, Any]:
     """Parse CV from markdown file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            cv_text = f.read()
-        parser = CVParser(cv_text)
-        return parser.parse()
+        cv_text = Path(file_path).read_text(encoding="utf-8")
     except FileNotFoundError:
         print(f"✗ CV file not found: {file_path}")
         return {}
-    except Exception as e:
-        print(f"✗ Error parsing CV: {e}")
-        return {}
+    return parse_cv_text(cv_text)
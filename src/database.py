@@ -1,12 +1,38 @@
 """Database initialization and session management."""
 
 import os
+from typing import Dict, Set
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.models import Base
 
+# Engines and session factories are cached per database URL so every
+# get_session() call shares one connection pool instead of rebuilding the
+# dialect and pool each time. Keying by URL keeps tests that repoint
+# DATABASE_URL working.
+_ENGINES: Dict[str, Engine] = {}
+_SESSION_FACTORIES: Dict[str, sessionmaker] = {}
+
+# Engines whose schema init_db() has already created.
+# create_all() inspects every table before issuing DDL, which is a round trip
+# per table on Postgres for each warm Lambda invocation.
+_SCHEMA_READY: Set[Engine] = set()
+
+# Applied to every new SQLite connection. WAL lets readers run alongside the
+# scraper's writes and, with synchronous=NORMAL, turns each commit into a WAL
+# append instead of a full fsync of the database file.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 
 def get_database_url() -> str:
     """Get database URL from environment or use SQLite default."""
@@ -15,21 +41,58 @@ def get_database_url() -> str:
 
 def init_db() -> None:
     """Initialize database schema."""
-    engine = create_engine(get_database_url(), echo=False)
-    Base.metadata.create_all(engine)
+    engine = get_engine()
+    if engine not in _SCHEMA_READY:
+        Base.metadata.create_all(engine)
+        _SCHEMA_READY.add(engine)
     print(f"✓ Database initialized at {get_database_url()}")
 
 
 def get_session() -> Session:
     """Get a new database session."""
-    engine = create_engine_instance()
-    session_factory = sessionmaker(bind=engine)
-    return session_factory()
+    return _session_factory()
 
 
-def create_engine_instance():
-    """Create and return SQLAlchemy engine."""
+def get_engine() -> Engine:
+    """Return the shared engine for the current DATABASE_URL, creating it lazily."""
     url = get_database_url()
+    engine = _ENGINES.get(url)
+    if engine is None:
+        engine = _build_engine(url)
+        _ENGINES[url] = engine
+    return engine
+
+
+def create_engine_instance() -> Engine:
+    """Return the shared SQLAlchemy engine."""
+    return get_engine()
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections and drop the cached engines.
+
+    Call before the SQLite file is replaced or copied (see s3_sync): closing
+    the last connection checkpoints the WAL back into the main database file.
+    The replacement file (or a fresh in-memory database) may lack the schema,
+    so the next init_db() creates it again.
+    """
+    for engine in _ENGINES.values():
+        engine.dispose()
+    _ENGINES.clear()
+    _SESSION_FACTORIES.clear()
+    _SCHEMA_READY.clear()
+
+
+def _session_factory() -> Session:
+    url = get_database_url()
+    factory = _SESSION_FACTORIES.get(url)
+    if factory is None:
+        factory = sessionmaker(bind=get_engine(), expire_on_commit=False)
+        _SESSION_FACTORIES[url] = factory
+    return factory()
+
+
+def _build_engine(url: str) -> Engine:
     kwargs: dict = {"echo": False}
     if url.startswith("postgresql"):
         # Neon serverless drops idle connections after ~5 min.
@@ -39,6 +102,7 @@ def create_engine_instance():
         kwargs.update(
             {
                 "pool_pre_ping": True,
+                "pool_use_lifo": True,
                 "pool_size": 5,
                 "max_overflow": 10,
                 "connect_args": {
@@ -49,4 +113,28 @@ def create_engine_instance():
                 },
             }
         )
+    elif url.startswith("sqlite"):
+        if ":memory:" in url or url in ("sqlite://", "sqlite:///"):
+            # One shared connection, otherwise each checkout gets its own
+            # empty in-memory database.
+            kwargs.update(
+                {
+                    "poolclass": StaticPool,
+                    "connect_args": {"check_same_thread": False},
+                }
+            )
+        else:
+            kwargs["pool_use_lifo"] = True
+        engine = create_engine(url, **kwargs)
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
     return create_engine(url, **kwargs)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
@@ -51,7 +51,10 @@ class IncrementalScraper:
         scraper = cls(self.session)
 
         # Run scraper
-        jobs = scraper.scrape(**kwargs)
+        try:
+            jobs = scraper.scrape(**kwargs)
+        finally:
+            scraper.close()
 
         # Filter jobs to only those posted recently
         cutoff = datetime.utcnow() - timedelta(hours=lookback_hours)
@@ -15,7 +15,7 @@ import re
 from difflib import SequenceMatcher
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.models import Job, JobMatch, Skill, User, UserPreferences
 
@@ -29,6 +29,11 @@ _MAX_EXPERIENCE = 15.0
 _MAX_LOCATION = 15.0
 _MAX_SALARY = 10.0
 
+# Query options for loading the users to match: compute_match_for_user reads
+# each user's preferences and skills, so fetch them for all users in one
+# IN (...) query per relationship instead of two lazy loads per user.
+USER_MATCH_OPTIONS = (selectinload(User.preferences), selectinload(User.skills))
+
 _STOPWORDS = {"the", "a", "an", "and", "or", "of", "in", "at", "for", "to", "with"}
 
 
@@ -61,6 +66,10 @@ _USER_SENIORITY = {"junior": 1, "mid": 2, "senior": 3, "lead": 3}
 # Splits on: pipe, bullet (●), 2+ spaces, or " . " (dot surrounded by spaces).
 _SKILL_SPLIT_RE = re.compile(r"[|●\n]+|(?:\s+\.\s+)|\s{2,}")
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_TITLE_STRIP_RE = re.compile(r"[^a-z0-9 ]")
+_DIGIT_RE = re.compile(r"\d")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -75,9 +84,7 @@ def _similarity(a: str, b: str) -> float:
 
 def _title_words(title: str) -> set:
     return {
-        w
-        for w in re.sub(r"[^a-z0-9 ]", "", title.lower()).split()
-        if w not in _STOPWORDS
+        w for w in _TITLE_STRIP_RE.sub("", title.lower()).split() if w not in _STOPWORDS
     }
 
 
@@ -99,7 +106,7 @@ def _location_terms(locs: List[str]) -> List[str]:
     for loc in locs:
         for part in loc.split(","):
             part = part.strip()
-            if part and not re.search(r"\d", part) and len(part) > 2:
+            if part and not _DIGIT_RE.search(part) and len(part) > 2:
                 terms.append(part.lower())
     return terms
 
@@ -143,13 +150,22 @@ def _skill_matches(req: str, skill: str) -> bool:
     Deliberately does NOT check `req in skill` to avoid false positives
     when a skill string is long (e.g. a partially-split multi-skill blob).
     """
-    req_l = req.lower()
     skill_l = skill.lower()
+    return _skill_covers(req.lower(), _words(req.lower()), skill_l, _words(skill_l))
+
+
+def _words(text: str) -> frozenset:
+    """Lowercase alphanumeric tokens of *text*, minus stopwords."""
+    return frozenset(_NON_ALNUM_RE.sub(" ", text).split()) - _STOPWORDS
+
+
+def _skill_covers(
+    req_l: str, req_words: frozenset, skill_l: str, skill_words: frozenset
+) -> bool:
+    """_skill_matches on pre-lowered, pre-tokenized inputs."""
     if skill_l in req_l:
         return True
-    req_words = set(re.sub(r"[^a-z0-9]", " ", req_l).split()) - _STOPWORDS
-    skill_words = set(re.sub(r"[^a-z0-9]", " ", skill_l).split()) - _STOPWORDS
-    return bool(req_words & skill_words) if (req_words and skill_words) else False
+    return not req_words.isdisjoint(skill_words)
 
 
 # ---------------------------------------------------------------------------
@@ -186,14 +202,18 @@ def _score_skills(requirements: Optional[List[str]], user_skills: List[Skill]) -
         return _MAX_SKILLS * 0.4
     if not user_skills:
         return 0.0
-    reqs = [r.lower() for r in requirements]
     skill_names = _normalize_skills(user_skills)
     if not skill_names:
         return 0.0
-    req_matches = sum(
-        1 for r in reqs if any(_skill_matches(r, sk) for sk in skill_names)
-    )
-    coverage = req_matches / len(reqs)
+    # Tokenize each skill once rather than once per requirement
+    skills = [(sk, _words(sk)) for sk in skill_names]
+    req_matches = 0
+    for r in requirements:
+        req_l = r.lower()
+        req_words = _words(req_l)
+        if any(_skill_covers(req_l, req_words, sk, words) for sk, words in skills):
+            req_matches += 1
+    coverage = req_matches / len(requirements)
     return min(_MAX_SKILLS, coverage * _MAX_SKILLS)
 
 
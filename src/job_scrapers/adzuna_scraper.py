@@ -73,6 +73,8 @@ class AdzunaScraper(BaseScraper):
         self.search_terms = search_terms or self._search_terms_from_prefs()
         self.app_id = app_id or os.environ.get("ADZUNA_APP_ID", "")
         self.app_key = app_key or os.environ.get("ADZUNA_APP_KEY", "")
+        # One pooled session keeps the connection alive across countries and pages.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "adzuna"
@@ -148,7 +150,7 @@ class AdzunaScraper(BaseScraper):
                             "content-type": "application/json",
                         }
 
-                        resp = requests.get(url, params=params, timeout=15)
+                        resp = self._http.get(url, params=params, timeout=15)
 
                         if resp.status_code == 401:
                             logger.warning("Adzuna API authentication failed")
@@ -174,7 +176,7 @@ class AdzunaScraper(BaseScraper):
                             break
 
                         consecutive_errors = 0  # reset on success
-                        data = resp.json()
+                        data = self._decode_json(resp)
                         results = data.get("results", [])
 
                         if not results:
@@ -237,13 +239,9 @@ class AdzunaScraper(BaseScraper):
             salary_max = int(salary_max)
 
         # Parse date
-        posted_date = datetime.utcnow()
-        created = raw_job.get("created")
-        if created:
-            try:
-                posted_date = datetime.fromisoformat(created.replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("created")) or datetime.utcnow()
+        )
 
         # Extract description (plain text from Adzuna)
         description = raw_job.get("description", "")
@@ -8,6 +8,7 @@ No authentication required.
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -18,6 +19,9 @@ from src.job_scrapers.base_scraper import BaseScraper
 
 logger = logging.getLogger("jobhunter.scrapers.ashby")
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # Companies using Ashby with confirmed job listings.
 # Covers modern startups, fintech, AI/ML, infra, and European scale-ups.
 DEFAULT_BOARD_SLUGS = [
@@ -74,6 +78,8 @@ class AshbyScraper(BaseScraper):
     def __init__(self, session: Session, board_slugs: Optional[List[str]] = None):
         super().__init__(session)
         self.board_slugs = board_slugs or DEFAULT_BOARD_SLUGS
+        # One pooled session keeps the connection alive across boards.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "ashby"
@@ -88,40 +94,41 @@ class AshbyScraper(BaseScraper):
             List of raw job dicts from the Ashby API
         """
         board_slugs = kwargs.get("board_slugs", self.board_slugs)
-        all_jobs: List[Dict[str, Any]] = []
+        return self._fetch_concurrently(self._fetch_board, board_slugs)
 
-        for slug in board_slugs:
-            try:
-                url = f"{ASHBY_API_BASE}/{slug}"
-                resp = requests.get(url, timeout=15)
+    def _fetch_board(self, slug: str) -> List[Dict[str, Any]]:
+        """Fetch one Ashby board; returns [] if it is missing or errors."""
+        try:
+            url = f"{ASHBY_API_BASE}/{slug}"
+            resp = self._http.get(url, timeout=15)
 
-                if resp.status_code == 404:
-                    logger.debug(f"Board not found: {slug}")
-                    continue
-                if resp.status_code != 200:
-                    logger.warning(
-                        f"Ashby API error for {slug}: HTTP {resp.status_code}"
-                    )
-                    continue
+            if resp.status_code == 404:
+                logger.debug(f"Board not found: {slug}")
+                return []
+            if resp.status_code != 200:
+                logger.warning(f"Ashby API error for {slug}: HTTP {resp.status_code}")
+                return []
 
-                data = resp.json()
-                jobs = data.get("jobs", [])
+            data = self._decode_json(resp)
+            jobs = data.get("jobs", [])
 
-                # Only include listed jobs
-                jobs = [j for j in jobs if j.get("isListed", True)]
+            # Only include listed jobs
+            jobs = [j for j in jobs if j.get("isListed", True)]
 
-                # Tag each job with the board slug
-                for job in jobs:
-                    job["_board_slug"] = slug
+            # Tag each job with the board slug
+            for job in jobs:
+                job["_board_slug"] = slug
 
-                all_jobs.extend(jobs)
-                logger.info(f"Fetched {len(jobs)} jobs from {slug}")
+            logger.info(f"Fetched {len(jobs)} jobs from {slug}")
+            return jobs
 
-            except requests.RequestException as e:
-                logger.warning(f"Failed to fetch from {slug}: {e}")
-                continue
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch from {slug}: {e}")
+            return []
 
-        return all_jobs
+    def _raw_job_id(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Return the job's id, matching source_job_id from _parse_job()."""
+        return str(raw_job.get("id", ""))
 
     def _parse_job(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
         """Parse an Ashby API job object into standardized format."""
@@ -151,15 +158,9 @@ class AshbyScraper(BaseScraper):
             description = self._strip_html(html)
 
         # Parse published date
-        posted_date = datetime.utcnow()
-        published_at = raw_job.get("publishedAt")
-        if published_at:
-            try:
-                posted_date = datetime.fromisoformat(
-                    published_at.replace("Z", "+00:00")
-                )
-            except (ValueError, TypeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("publishedAt")) or datetime.utcnow()
+        )
 
         apply_url = raw_job.get("applyUrl") or raw_job.get("jobUrl", "")
         company = board_slug.replace("-", " ").title()
@@ -186,10 +187,8 @@ class AshbyScraper(BaseScraper):
     @staticmethod
     def _strip_html(html: str) -> str:
         """Strip HTML tags from a string."""
-        import re
-
         if not html:
             return ""
-        clean = re.sub(r"<[^>]+>", " ", html)
-        clean = re.sub(r"\s+", " ", clean).strip()
+        clean = _TAG_RE.sub(" ", html)
+        clean = _WHITESPACE_RE.sub(" ", clean).strip()
         return clean
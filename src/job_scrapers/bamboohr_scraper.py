@@ -14,11 +14,10 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.html_text import html_to_text
 
 # Map of slug → display company name. Falls back to slug.title().
 COMPANY_NAMES: Dict[str, str] = {
@@ -71,7 +70,7 @@ class BambooHRScraper(BaseScraper):
 
     def __init__(self, session: Session, company_slugs: Optional[List[str]] = None):
         super().__init__(session)
-        self._http = requests.Session()
+        self._http = self._new_http_session()
         self.company_slugs = company_slugs or DEFAULT_COMPANY_SLUGS
 
     def _get_source_name(self) -> str:
@@ -88,7 +87,7 @@ class BambooHRScraper(BaseScraper):
                     timeout=15,
                 )
                 resp.raise_for_status()
-                jobs = resp.json().get("result", [])
+                jobs = self._decode_json(resp).get("result", [])
                 self.logger.info("bamboohr slug=%s listed=%d", slug, len(jobs))
 
                 for job in jobs:
@@ -120,7 +119,7 @@ class BambooHRScraper(BaseScraper):
                 timeout=15,
             )
             if resp.status_code == 200:
-                return resp.json().get("result", {}).get("jobOpening", {})
+                return self._decode_json(resp).get("result", {}).get("jobOpening", {})
         except Exception as exc:
             self.logger.warning(
                 "bamboohr slug=%s job_id=%s detail_error=%s", slug, job_id, exc
@@ -153,8 +152,8 @@ class BambooHRScraper(BaseScraper):
         description: Optional[str] = None
         desc_html = detail.get("description") or ""
         if desc_html:
-            soup = BeautifulSoup(html_module.unescape(desc_html), "html.parser")
-            description = soup.get_text(separator="\n").strip() or None
+            text = html_to_text(html_module.unescape(desc_html), separator="\n")
+            description = text.strip() or None
 
         date_str = detail.get("datePosted")
         try:
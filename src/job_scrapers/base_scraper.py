@@ -1,18 +1,72 @@
 """Base scraper abstract class for all job scrapers."""
 
 import logging
+import os
 import re
+import sys
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, List, Optional
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+import requests
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.models import Job, ScraperMetric, UserPreferences
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    _orjson = None
+
+try:
+    import ciso8601 as _ciso8601
+except ImportError:  # pragma: no cover - ciso8601 is an optional speed-up
+    _ciso8601 = None
+
 _logger = logging.getLogger("jobhunter.scrapers")
 
+# Max ids per IN (...) clause when checking for existing jobs; stays well
+# under SQLite's bound-parameter limit.
+_ID_LOOKUP_CHUNK = 500
+
+# Concurrent requests per scraper when fetching many boards from one API.
+_FETCH_WORKERS = 8
+
+_T = TypeVar("_T")
+
+# datetime.fromisoformat only accepts a trailing "Z" from Python 3.11.
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Set SCRAPER_HTTP_CACHE to a path to cache GET responses on disk (requires
+# requests-cache). Meant for development, where re-running a scraper would
+# otherwise re-download every board; leave unset in production.
+_HTTP_CACHE_ENV = "SCRAPER_HTTP_CACHE"
+_HTTP_CACHE_TTL = timedelta(hours=1)
+
+# Job columns copied verbatim from a scraper's parsed dict by _job_row().
+_PARSED_JOB_FIELDS = (
+    "source_job_id",
+    "title",
+    "company",
+    "department",
+    "location",
+    "remote",
+    "salary_min",
+    "salary_max",
+    "description",
+    "requirements",
+    "nice_to_haves",
+    "apply_url",
+    "posted_date",
+    "company_industry",
+    "company_size",
+)
+
 # All US state names in lowercase.  Used by _infer_country to detect US-only
 # remote roles whose country restriction is embedded in the description text
 # rather than a structured field.
@@ -76,6 +130,11 @@ _US_STATES = frozenset(
 # ambiguous with the country Georgia; "Texas" appears in many non-US contexts.
 _US_STATE_THRESHOLD = 3
 
+# Whole-word pattern per state, compiled once rather than per description.
+_US_STATE_RES = tuple(
+    re.compile(r"\b" + re.escape(state) + r"\b") for state in sorted(_US_STATES)
+)
+
 # Per-country regex fragments for residency detection.
 # "strong" — unambiguous even mid-sentence; safe for verb+country patterns.
 # "weak"   — too short/common as English words; only safe in "X-only" suffix.
@@ -167,6 +226,42 @@ class BaseScraper(ABC):
         # suppresses zero-result alerts when this is non-None.
         self.last_skip_reason: Optional[str] = None
 
+    def _new_http_session(self) -> requests.Session:
+        """Return the HTTP session a scraper should reuse for its requests.
+
+        A plain requests.Session unless SCRAPER_HTTP_CACHE is set, in which
+        case GET responses are cached in that SQLite file for an hour.
+        """
+        cache_path = os.getenv(_HTTP_CACHE_ENV)
+        if cache_path:
+            try:
+                from requests_cache import CachedSession
+            except ImportError:
+                self.logger.warning(
+                    "%s is set but requests-cache is not installed; not caching",
+                    _HTTP_CACHE_ENV,
+                )
+            else:
+                return CachedSession(
+                    cache_path,
+                    backend="sqlite",
+                    expire_after=_HTTP_CACHE_TTL,
+                    allowable_methods=("GET",),
+                    stale_if_error=True,
+                )
+        return requests.Session()
+
+    def close(self) -> None:
+        """Close the HTTP session opened by _new_http_session(), if any.
+
+        Callers that build a scraper per run (CLI, worker, Lambda) call this
+        when done, so pooled connections and the SQLite handle behind a
+        SCRAPER_HTTP_CACHE session are released.
+        """
+        http = getattr(self, "_http", None)
+        if http is not None:
+            http.close()
+
     @abstractmethod
     def _get_source_name(self) -> str:
         """Get the name of the job source.
@@ -203,6 +298,15 @@ class BaseScraper(ABC):
         """
         pass
 
+    def _raw_job_id(self, raw_job: dict) -> Optional[str]:
+        """Return the source_job_id _parse_job would give raw_job, if cheap.
+
+        Scrapers that override this let scrape() skip _parse_job (HTML
+        stripping and the requirements keyword scan) for listings that are
+        already stored. The default returns None, so every job is parsed.
+        """
+        return None
+
     def scrape(self, **kwargs) -> List[Job]:
         """Main scraping method with retry/backoff for transient fetch errors.
 
@@ -253,22 +357,28 @@ class BaseScraper(ABC):
             # pool_pre_ping will then open a fresh connection on the next checkout.
             self.session.invalidate()
 
-            # Load all existing source_job_ids for this source in one query
-            existing_ids: set = self._load_existing_ids()
-
-            jobs: List[Job] = []
+            # One timestamp for the whole batch, shared by inserts and the
+            # scraped_at refresh below.
+            now = datetime.utcnow()
+            parsed_jobs: List[dict] = []
             parse_errors = 0
             seen_source_ids: set = set()
 
-            for raw_job in raw_jobs:
+            # Most listings on a re-scrape are already stored; when the raw id
+            # is known up front, look those up first and only parse the rest.
+            raw_ids = [self._raw_job_id(raw_job) for raw_job in raw_jobs]
+            stored_ids = self._load_existing_ids(set(filter(None, raw_ids)))
+            seen_source_ids.update(stored_ids)
+
+            for raw_job, raw_id in zip(raw_jobs, raw_ids):
+                if raw_id in stored_ids:
+                    continue
                 try:
                     parsed_data = self._parse_job(raw_job)
                     job_id = parsed_data.get("source_job_id")
                     if job_id:
                         seen_source_ids.add(job_id)
-                    if job_id in existing_ids:
-                        continue
-                    jobs.append(self._create_job_object(parsed_data))
+                    parsed_jobs.append(parsed_data)
                 except Exception as e:
                     self.logger.exception(
                         f"Error parsing job from {self.source_name}: {e}"
@@ -276,10 +386,32 @@ class BaseScraper(ABC):
                     parse_errors += 1
                     continue
 
-            # Save all new jobs in a single commit
-            if jobs:
-                self.session.add_all(jobs)
-                self.session.commit()
+            # Raw payloads (whole board dumps with HTML descriptions) are not
+            # needed past parsing; drop them so they can be freed before the
+            # batch is written.
+            del raw_jobs, raw_ids
+
+            # Look up only the ids in this batch, in IN-chunks, rather than
+            # loading every id ever stored for the source.
+            existing_ids = stored_ids | self._load_existing_ids(
+                seen_source_ids - stored_ids
+            )
+
+            rows: List[dict] = []
+            for parsed_data in parsed_jobs:
+                if parsed_data.get("source_job_id") in existing_ids:
+                    continue
+                try:
+                    rows.append(self._job_row(parsed_data, scraped_at=now))
+                except Exception as e:
+                    self.logger.exception(
+                        f"Error parsing job from {self.source_name}: {e}"
+                    )
+                    parse_errors += 1
+
+            # Insert new jobs and refresh seen ones in one transaction, so the
+            # run costs a single commit (one WAL append on SQLite).
+            jobs = self._insert_new_jobs(rows)
 
             # Mark all jobs seen in this fetch as active and refresh scraped_at
             # so the expiry clock resets for still-live listings.
@@ -288,17 +420,17 @@ class BaseScraper(ABC):
                     Job.source == self.source_name,
                     Job.source_job_id.in_(seen_source_ids),
                 ).update(
-                    {"scraped_at": datetime.utcnow(), "is_active": True},
+                    {"scraped_at": now, "is_active": True},
                     synchronize_session=False,
                 )
-                self.session.commit()
+            self.session.commit()
 
             # Record a single summary metric for the run
             try:
                 self._record_metric(
                     "jobs_added",
                     len(jobs),
-                    f"raw={len(raw_jobs)} errors={parse_errors}",
+                    f"raw={self.last_raw_count} errors={parse_errors}",
                 )
             except Exception:
                 self.logger.debug("Failed to record jobs_added metric")
@@ -427,9 +559,7 @@ class BaseScraper(ABC):
         # Count distinct state names that appear as whole words in the text.
         desc_lower = description.lower()
         state_count = sum(
-            1
-            for state in _US_STATES
-            if re.search(r"\b" + re.escape(state) + r"\b", desc_lower)
+            1 for state_re in _US_STATE_RES if state_re.search(desc_lower)
         )
         if state_count >= _US_STATE_THRESHOLD:
             _logger.debug(
@@ -439,14 +569,165 @@ class BaseScraper(ABC):
 
         return None
 
-    def _load_existing_ids(self) -> set:
-        """Load all known source_job_ids for this source in one query."""
-        rows = (
-            self.session.query(Job.source_job_id)
-            .filter(Job.source == self.source_name)
-            .all()
+    @staticmethod
+    def _decode_json(resp: requests.Response) -> Any:
+        """Decode a JSON response body, with orjson when it is installed.
+
+        orjson parses the raw bytes directly instead of decoding them to text
+        first, which matters for board dumps that embed every job's HTML
+        description. Malformed bodies raise requests' JSONDecodeError either
+        way, so callers catching RequestException keep working.
+        """
+        if _orjson is None:
+            return resp.json()
+        try:
+            return _orjson.loads(resp.content)
+        except _orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    @staticmethod
+    def _parse_iso_datetime(value: Any) -> Optional[datetime]:
+        """Parse an ISO 8601 timestamp from an API payload.
+
+        Uses ciso8601's C parser when it is installed, otherwise
+        datetime.fromisoformat (rewriting a trailing "Z" only on Pythons that
+        need it).
+
+        Returns:
+            The parsed datetime, or None when value is empty or malformed
+        """
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            if _ciso8601 is not None:
+                return _ciso8601.parse_datetime(value)
+            if not _FROMISOFORMAT_ACCEPTS_Z and value[-1] == "Z":
+                value = value[:-1] + "+00:00"
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    def _fetch_concurrently(
+        self, fetch_one: Callable[[_T], List[dict]], items: Iterable[_T]
+    ) -> List[dict]:
+        """Call fetch_one for each item on a small thread pool.
+
+        Board-per-request APIs (Greenhouse, Lever, Ashby) are latency-bound,
+        so overlapping the requests cuts a run from one round trip per board
+        to roughly one per _FETCH_WORKERS boards. fetch_one must handle its
+        own request errors.
+
+        Returns:
+            The concatenated results, in the order of items
+        """
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            return [job for jobs in executor.map(fetch_one, items) for job in jobs]
+
+    def _load_existing_ids(self, source_job_ids: Optional[Iterable[str]] = None) -> set:
+        """Load known source_job_ids for this source.
+
+        Args:
+            source_job_ids: Restrict the lookup to these ids. When omitted,
+                every id stored for the source is returned.
+
+        Returns:
+            Set of source_job_ids already in the database
+        """
+        # Core select of the one column: scalars come straight off the cursor,
+        # with no Job hydration or identity-map bookkeeping per row.
+        stmt = select(Job.source_job_id).where(Job.source == self.source_name)
+        if source_job_ids is None:
+            return set(self.session.scalars(stmt))
+
+        ids = list(source_job_ids)
+        existing: set = set()
+        for start in range(0, len(ids), _ID_LOOKUP_CHUNK):
+            chunk = ids[start : start + _ID_LOOKUP_CHUNK]
+            existing.update(
+                self.session.scalars(stmt.where(Job.source_job_id.in_(chunk)))
+            )
+        return existing
+
+    def _insert_new_jobs(self, rows: List[dict]) -> List[Job]:
+        """Insert job rows, letting the database skip ones that already exist.
+
+        Uses INSERT ... ON CONFLICT (source, source_job_id) DO NOTHING so the
+        unique index resolves duplicates (including ones inserted concurrently
+        by another scraper run) without a SELECT per row.
+
+        The caller owns the transaction and must commit.
+
+        Args:
+            rows: Column dicts as built by _job_row()
+
+        Returns:
+            Job objects for the rows actually inserted
+        """
+        if not rows:
+            return []
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "sqlite":
+            insert_stmt = sqlite_insert(Job)
+        elif dialect == "postgresql":
+            insert_stmt = pg_insert(Job)
+        else:
+            jobs = [Job(**row) for row in rows]
+            self.session.add_all(jobs)
+            self.session.flush()
+            return jobs
+
+        stmt = insert_stmt.on_conflict_do_nothing(
+            index_elements=["source", "source_job_id"]
+        ).returning(Job)
+        return list(self.session.scalars(stmt, rows))
+
+    def _store_raw_jobs(self, raw_jobs: List[Any]) -> int:
+        """Parse raw jobs and bulk-insert the new ones in a single commit.
+
+        Used by keyword scrapes that filter the fetched listings themselves
+        instead of going through scrape().
+
+        Args:
+            raw_jobs: Raw job payloads accepted by _parse_job()
+
+        Returns:
+            Number of jobs inserted
+        """
+        now = datetime.utcnow()
+        parsed_jobs: List[dict] = []
+        for raw_job in raw_jobs:
+            try:
+                parsed_jobs.append(self._parse_job(raw_job))
+            except Exception as e:
+                self.logger.warning(f"Error parsing {self.source_name} job: {e}")
+
+        # Boards can list the same posting twice; keep the first occurrence.
+        existing_ids = self._load_existing_ids(
+            {p["source_job_id"] for p in parsed_jobs if p.get("source_job_id")}
         )
-        return {row[0] for row in rows}
+        rows: List[dict] = []
+        for parsed in parsed_jobs:
+            job_id = parsed.get("source_job_id")
+            if job_id in existing_ids:
+                continue
+            try:
+                rows.append(self._job_row(parsed, scraped_at=now))
+            except Exception as e:
+                self.logger.warning(f"Error parsing {self.source_name} job: {e}")
+                continue
+            if job_id:
+                existing_ids.add(job_id)
+        jobs_added = len(self._insert_new_jobs(rows))
+
+        if jobs_added:
+            self.session.commit()
+            try:
+                self._record_metric("jobs_added", jobs_added, None)
+            except Exception:
+                pass
+
+        return jobs_added
 
     def _create_job_object(self, parsed_data: dict) -> Job:
         """Create a Job object from parsed data.
@@ -457,31 +738,29 @@ class BaseScraper(ABC):
         Returns:
             Job object ready to be saved
         """
+        return Job(**self._job_row(parsed_data))
+
+    def _job_row(
+        self, parsed_data: dict, scraped_at: Optional[datetime] = None
+    ) -> dict:
+        """Build the jobs-table column values for one parsed job.
+
+        Args:
+            parsed_data: Parsed job data
+            scraped_at: Timestamp to record; defaults to now
+
+        Returns:
+            Dict of Job column names to values
+        """
+        get = parsed_data.get
+        row = {field: get(field) for field in _PARSED_JOB_FIELDS}
+        row["source"] = self.source_name
+        row["scraped_at"] = scraped_at or datetime.utcnow()
+        row["source_type"] = get("source_type", "aggregator")
         # Use the explicitly parsed country when available; otherwise try to
         # infer it from description text (catches US-state-restricted remote
         # roles that embed residency requirements in free text).
-        country = parsed_data.get("country") or self._infer_country(
-            parsed_data.get("description"), parsed_data.get("location")
-        )
-
-        return Job(
-            source=self.source_name,
-            source_job_id=parsed_data.get("source_job_id"),
-            title=parsed_data.get("title"),
-            company=parsed_data.get("company"),
-            department=parsed_data.get("department"),
-            location=parsed_data.get("location"),
-            remote=parsed_data.get("remote"),
-            country=country,
-            salary_min=parsed_data.get("salary_min"),
-            salary_max=parsed_data.get("salary_max"),
-            description=parsed_data.get("description"),
-            requirements=parsed_data.get("requirements"),
-            nice_to_haves=parsed_data.get("nice_to_haves"),
-            apply_url=parsed_data.get("apply_url"),
-            posted_date=parsed_data.get("posted_date"),
-            scraped_at=datetime.utcnow(),
-            company_industry=parsed_data.get("company_industry"),
-            company_size=parsed_data.get("company_size"),
-            source_type=parsed_data.get("source_type", "aggregator"),
+        row["country"] = get("country") or self._infer_country(
+            row["description"], row["location"]
         )
+        return row
@@ -15,7 +15,6 @@ import re
 import time
 from typing import Any, Dict, List, Optional
 
-import requests
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
@@ -25,6 +24,8 @@ _SITEMAPS = [
     "https://careers.bcg.com/global/en/sitemap2.xml",
 ]
 _DEPARTMENT_FILTER = "technology and engineering"
+_SITEMAP_LOC_RE = re.compile(r"<loc>(.*?)</loc>")
+_JOB_ID_RE = re.compile(r"/job/(\d+)/")
 _HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -39,7 +40,7 @@ class BCGScraper(BaseScraper):
 
     def __init__(self, session: Session):
         super().__init__(session)
-        self._http = requests.Session()
+        self._http = self._new_http_session()
         self._http.headers.update(_HEADERS)
 
     def _get_source_name(self) -> str:
@@ -78,8 +79,8 @@ class BCGScraper(BaseScraper):
         for sitemap_url in _SITEMAPS:
             resp = self._http.get(sitemap_url, timeout=15)
             resp.raise_for_status()
-            for url in re.findall(r"<loc>(.*?)</loc>", resp.text):
-                m = re.search(r"/job/(\d+)/", url)
+            for url in _SITEMAP_LOC_RE.findall(resp.text):
+                m = _JOB_ID_RE.search(url)
                 if m and m.group(1) not in seen:
                     seen.add(m.group(1))
                     pairs.append((m.group(1), url))
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.tech_keywords import TECH_KEYWORDS, find_keywords
 
 
 class GitHubJobsScraper(BaseScraper):
@@ -70,14 +71,9 @@ class GitHubJobsScraper(BaseScraper):
             Parsed job data with standardized fields
         """
         # Parse posted date (GitHub provides relative date, use current time)
-        posted_date = datetime.utcnow()
-        if "created_at" in raw_job:
-            try:
-                posted_date = datetime.fromisoformat(
-                    raw_job["created_at"].replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("created_at")) or datetime.utcnow()
+        )
 
         # Extract requirements from description (simple keyword matching)
         description = raw_job.get("description", "")
@@ -111,48 +107,7 @@ class GitHubJobsScraper(BaseScraper):
         Returns:
             List of requirements
         """
-        # Simple extraction of common tech keywords
-        keywords = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "go",
-            "rust",
-            "c++",
-            "csharp",
-            "c#",
-            "sql",
-            "react",
-            "vue",
-            "angular",
-            "node",
-            "express",
-            "django",
-            "flask",
-            "fastapi",
-            "aws",
-            "gcp",
-            "azure",
-            "docker",
-            "kubernetes",
-            "git",
-            "linux",
-            "postgresql",
-            "mongodb",
-            "redis",
-            "elasticsearch",
-            "graphql",
-            "rest api",
-            "microservices",
-            "agile",
-            "ci/cd",
-            "jenkins",
-            "terraform",
-        ]
-
-        desc_lower = description.lower()
-        found_keywords = [keyword for keyword in keywords if keyword in desc_lower]
+        found_keywords = find_keywords(description, TECH_KEYWORDS)
         return found_keywords if found_keywords else None
 
     def scrape_by_keywords(
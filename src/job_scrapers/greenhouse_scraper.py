@@ -13,10 +13,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.html_text import html_to_text
+from src.job_scrapers.tech_keywords import ATS_TECH_KEYWORDS, find_keywords
 
 logger = logging.getLogger("jobhunter.scrapers.greenhouse")
 
@@ -96,6 +97,8 @@ class GreenhouseScraper(BaseScraper):
     def __init__(self, session: Session, board_tokens: Optional[List[str]] = None):
         super().__init__(session)
         self.board_tokens = board_tokens or DEFAULT_BOARD_TOKENS
+        # One pooled session keeps the connection alive across boards.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "greenhouse"
@@ -111,38 +114,41 @@ class GreenhouseScraper(BaseScraper):
             List of raw job dicts from the Greenhouse API
         """
         board_tokens = kwargs.get("board_tokens", self.board_tokens)
-        all_jobs: List[Dict[str, Any]] = []
-
-        for token in board_tokens:
-            try:
-                url = f"{GREENHOUSE_API_BASE}/{token}/jobs"
-                params = {"content": "true"}
-                resp = requests.get(url, params=params, timeout=15)
-
-                if resp.status_code == 404:
-                    logger.debug(f"Board not found: {token}")
-                    continue
-                if resp.status_code != 200:
-                    logger.warning(
-                        f"Greenhouse API error for {token}: HTTP {resp.status_code}"
-                    )
-                    continue
-
-                data = resp.json()
-                jobs = data.get("jobs", [])
-
-                # Tag each job with the board token (company)
-                for job in jobs:
-                    job["_board_token"] = token
-
-                all_jobs.extend(jobs)
-                logger.info(f"Fetched {len(jobs)} jobs from {token}")
-
-            except requests.RequestException as e:
-                logger.warning(f"Failed to fetch from {token}: {e}")
-                continue
-
-        return all_jobs
+        return self._fetch_concurrently(self._fetch_board, board_tokens)
+
+    def _fetch_board(self, token: str) -> List[Dict[str, Any]]:
+        """Fetch one Greenhouse board; returns [] if it is missing or errors."""
+        try:
+            url = f"{GREENHOUSE_API_BASE}/{token}/jobs"
+            params = {"content": "true"}
+            resp = self._http.get(url, params=params, timeout=15)
+
+            if resp.status_code == 404:
+                logger.debug(f"Board not found: {token}")
+                return []
+            if resp.status_code != 200:
+                logger.warning(
+                    f"Greenhouse API error for {token}: HTTP {resp.status_code}"
+                )
+                return []
+
+            data = self._decode_json(resp)
+            jobs = data.get("jobs", [])
+
+            # Tag each job with the board token (company)
+            for job in jobs:
+                job["_board_token"] = token
+
+            logger.info(f"Fetched {len(jobs)} jobs from {token}")
+            return jobs
+
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch from {token}: {e}")
+            return []
+
+    def _raw_job_id(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Return the job's id, matching source_job_id from _parse_job()."""
+        return str(raw_job.get("id", ""))
 
     def _parse_job(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a Greenhouse API job object into standardized format."""
@@ -171,28 +177,23 @@ class GreenhouseScraper(BaseScraper):
 
         # Parse HTML content to plain text and extract requirements.
         # Greenhouse sometimes returns entity-escaped HTML (e.g. &lt;div&gt;)
-        # rather than raw HTML tags. Unescape first so BeautifulSoup can
+        # rather than raw HTML tags. Unescape first so the HTML parser can
         # parse it correctly regardless of encoding.
         description = ""
         content = raw_job.get("content", "")
         if content:
             content = html_module.unescape(content)
             if "<" in content:
-                soup = BeautifulSoup(content, "html.parser")
-                description = soup.get_text(separator="\n").strip()
+                description = html_to_text(content, separator="\n").strip()
             else:
                 description = content.strip()
 
         requirements = self._extract_requirements(description)
 
         # Parse updated date
-        posted_date = datetime.utcnow()
-        updated_at = raw_job.get("updated_at")
-        if updated_at:
-            try:
-                posted_date = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("updated_at")) or datetime.utcnow()
+        )
 
         # Build apply URL
         apply_url = raw_job.get("absolute_url", "")
@@ -223,70 +224,7 @@ class GreenhouseScraper(BaseScraper):
         if not description:
             return None
 
-        keywords = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "c#",
-            "golang",
-            "go",
-            "rust",
-            "ruby",
-            "scala",
-            "kotlin",
-            "swift",
-            "sql",
-            "nosql",
-            "postgresql",
-            "mysql",
-            "mongodb",
-            "redis",
-            "dynamodb",
-            "elasticsearch",
-            "aws",
-            "azure",
-            "gcp",
-            "google cloud",
-            "react",
-            "angular",
-            "vue",
-            "next.js",
-            "node.js",
-            "django",
-            "flask",
-            "fastapi",
-            "spring",
-            "rails",
-            "docker",
-            "kubernetes",
-            "terraform",
-            "ansible",
-            "git",
-            "ci/cd",
-            "jenkins",
-            "github actions",
-            "rest",
-            "graphql",
-            "grpc",
-            "microservices",
-            "machine learning",
-            "deep learning",
-            "pytorch",
-            "tensorflow",
-            "data engineering",
-            "spark",
-            "airflow",
-            "kafka",
-            "agile",
-            "scrum",
-            "linux",
-            "unix",
-        ]
-
-        desc_lower = description.lower()
-        found = [kw for kw in keywords if kw in desc_lower]
+        found = find_keywords(description, ATS_TECH_KEYWORDS)
         return found if found else None
 
     def scrape_by_keywords(
@@ -310,6 +248,7 @@ class GreenhouseScraper(BaseScraper):
         # Filter by keywords (match against title and description)
         filtered = []
         kw_lower = [k.lower() for k in keywords]
+        location_lower = location.lower() if location else None
         for job in raw_jobs:
             title = (job.get("title") or "").lower()
             content = (job.get("content") or "").lower()
@@ -318,32 +257,9 @@ class GreenhouseScraper(BaseScraper):
                 loc = (job["location"].get("name") or "").lower()
 
             if any(kw in title or kw in content for kw in kw_lower):
-                if location and location.lower() not in loc:
+                if location_lower and location_lower not in loc:
                     continue
                 filtered.append(job)
 
-        # Now run filtered jobs through the standard parse/persist pipeline
-        existing_ids = self._load_existing_ids()
-
-        jobs_added = 0
-        for raw_job in filtered:
-            try:
-                parsed = self._parse_job(raw_job)
-                if parsed.get("source_job_id") in existing_ids:
-                    continue
-                job = self._create_job_object(parsed)
-                self.session.add(job)
-                existing_ids.add(parsed.get("source_job_id"))
-                jobs_added += 1
-            except Exception as e:
-                logger.warning(f"Error parsing Greenhouse job: {e}")
-                continue
-
-        if jobs_added:
-            self.session.commit()
-            try:
-                self._record_metric("jobs_added", jobs_added, None)
-            except Exception:
-                pass
-
-        return jobs_added
+        # Parse, dedupe and bulk-insert the matches in one statement and commit
+        return self._store_raw_jobs(filtered)
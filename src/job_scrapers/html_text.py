@@ -0,0 +1,40 @@
+"""HTML-to-text conversion for scraped job descriptions.
+
+Uses lxml's C parser when it is installed, which is an order of magnitude
+faster than BeautifulSoup's pure-Python html.parser on long descriptions,
+and falls back to BeautifulSoup otherwise.
+"""
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree as _etree
+    from lxml import html as _lxml_html
+except ImportError:  # pragma: no cover - lxml is an optional speed-up
+    _lxml_html = None
+
+
+def html_to_text(html: str, separator: str = "") -> str:
+    """Return the text of an HTML fragment, dropping tags, scripts and styles.
+
+    Args:
+        html: HTML markup (plain text passes through unchanged)
+        separator: Joined between adjacent text nodes, as in
+            BeautifulSoup's get_text()
+
+    Returns:
+        The text content, unstripped
+    """
+    if not html:
+        return ""
+    if _lxml_html is None:
+        return BeautifulSoup(html, "html.parser").get_text(separator=separator)
+
+    try:
+        root = _lxml_html.document_fromstring(html)
+    except _etree.ParserError:
+        # Whitespace- or comment-only input has no document to parse
+        return ""
+    for element in root.iter("script", "style"):
+        element.drop_tree()
+    return separator.join(root.itertext())
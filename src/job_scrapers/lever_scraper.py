@@ -8,13 +8,14 @@ Endpoint: https://api.lever.co/v0/postings/{company}?mode=json
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.html_text import html_to_text
+from src.job_scrapers.tech_keywords import ATS_TECH_KEYWORDS, find_keywords
 
 logger = logging.getLogger("jobhunter.scrapers.lever")
 
@@ -39,6 +40,18 @@ DEFAULT_COMPANY_SLUGS = [
 
 LEVER_API_BASE = "https://api.lever.co/v0/postings"
 
+# Lever list headings that introduce a requirements section.
+REQUIREMENT_HEADINGS: Tuple[str, ...] = (
+    "requirement",
+    "qualif",
+    "what you",
+    "you have",
+    "you bring",
+    "must have",
+    "skills",
+    "experience",
+)
+
 
 class LeverScraper(BaseScraper):
     """Scraper for Lever-hosted job boards.
@@ -50,6 +63,8 @@ class LeverScraper(BaseScraper):
     def __init__(self, session: Session, company_slugs: Optional[List[str]] = None):
         super().__init__(session)
         self.company_slugs = company_slugs or DEFAULT_COMPANY_SLUGS
+        # One pooled session keeps the connection alive across companies.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "lever"
@@ -64,40 +79,41 @@ class LeverScraper(BaseScraper):
             List of raw job dicts from the Lever API
         """
         company_slugs = kwargs.get("company_slugs", self.company_slugs)
-        all_jobs: List[Dict[str, Any]] = []
-
-        for slug in company_slugs:
-            try:
-                url = f"{LEVER_API_BASE}/{slug}"
-                params = {"mode": "json"}
-                resp = requests.get(url, params=params, timeout=15)
-
-                if resp.status_code == 404:
-                    logger.debug(f"Company not found on Lever: {slug}")
-                    continue
-                if resp.status_code != 200:
-                    logger.warning(
-                        f"Lever API error for {slug}: HTTP {resp.status_code}"
-                    )
-                    continue
-
-                jobs = resp.json()
-                if not isinstance(jobs, list):
-                    logger.warning(f"Unexpected Lever response for {slug}")
-                    continue
-
-                # Tag each job with the company slug
-                for job in jobs:
-                    job["_company_slug"] = slug
-
-                all_jobs.extend(jobs)
-                logger.info(f"Fetched {len(jobs)} jobs from {slug}")
-
-            except requests.RequestException as e:
-                logger.warning(f"Failed to fetch from {slug}: {e}")
-                continue
-
-        return all_jobs
+        return self._fetch_concurrently(self._fetch_company, company_slugs)
+
+    def _fetch_company(self, slug: str) -> List[Dict[str, Any]]:
+        """Fetch one Lever company page; returns [] if it is missing or errors."""
+        try:
+            url = f"{LEVER_API_BASE}/{slug}"
+            params = {"mode": "json"}
+            resp = self._http.get(url, params=params, timeout=15)
+
+            if resp.status_code == 404:
+                logger.debug(f"Company not found on Lever: {slug}")
+                return []
+            if resp.status_code != 200:
+                logger.warning(f"Lever API error for {slug}: HTTP {resp.status_code}")
+                return []
+
+            jobs = self._decode_json(resp)
+            if not isinstance(jobs, list):
+                logger.warning(f"Unexpected Lever response for {slug}")
+                return []
+
+            # Tag each job with the company slug
+            for job in jobs:
+                job["_company_slug"] = slug
+
+            logger.info(f"Fetched {len(jobs)} jobs from {slug}")
+            return jobs
+
+        except requests.RequestException as e:
+            logger.warning(f"Failed to fetch from {slug}: {e}")
+            return []
+
+    def _raw_job_id(self, raw_job: Dict[str, Any]) -> Optional[str]:
+        """Return the job's id, matching source_job_id from _parse_job()."""
+        return raw_job.get("id", "")
 
     def _parse_job(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a Lever API posting object into standardized format."""
@@ -121,11 +137,7 @@ class LeverScraper(BaseScraper):
         if not description:
             html_desc = raw_job.get("description", "")
             if html_desc and "<" in html_desc:
-                description = (
-                    BeautifulSoup(html_desc, "html.parser")
-                    .get_text(separator="\n")
-                    .strip()
-                )
+                description = html_to_text(html_desc, separator="\n").strip()
             else:
                 description = html_desc
 
@@ -180,32 +192,22 @@ class LeverScraper(BaseScraper):
         for lst in lists:
             text = (lst.get("text") or "").lower()
             # Look for requirement-like sections
-            if any(
-                kw in text
-                for kw in [
-                    "requirement",
-                    "qualif",
-                    "what you",
-                    "you have",
-                    "you bring",
-                    "must have",
-                    "skills",
-                    "experience",
-                ]
-            ):
+            if any(kw in text for kw in REQUIREMENT_HEADINGS):
                 items = lst.get("content", "")
                 if isinstance(items, str):
                     # content is HTML — strip tags so <li> etc. don't leak
                     if "<" in items:
-                        items = BeautifulSoup(items, "html.parser").get_text(
-                            separator="\n"
-                        )
+                        items = html_to_text(items, separator="\n")
                     # Split by newlines or list markers
                     for line in items.split("\n"):
                         line = line.strip().lstrip("•-*")
                         if line and len(line) > 5:
                             requirements.append(line.strip())
 
+        # Postings often repeat a line across sections; keep the first copy
+        # so duplicates neither use up the 20 slots nor count twice in
+        # skill coverage.
+        requirements = list(dict.fromkeys(requirements))
         return requirements[:20] if requirements else None
 
     def _extract_requirements(self, description: str) -> Optional[List[str]]:
@@ -213,70 +215,7 @@ class LeverScraper(BaseScraper):
         if not description:
             return None
 
-        keywords = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "c#",
-            "golang",
-            "go",
-            "rust",
-            "ruby",
-            "scala",
-            "kotlin",
-            "swift",
-            "sql",
-            "nosql",
-            "postgresql",
-            "mysql",
-            "mongodb",
-            "redis",
-            "dynamodb",
-            "elasticsearch",
-            "aws",
-            "azure",
-            "gcp",
-            "google cloud",
-            "react",
-            "angular",
-            "vue",
-            "next.js",
-            "node.js",
-            "django",
-            "flask",
-            "fastapi",
-            "spring",
-            "rails",
-            "docker",
-            "kubernetes",
-            "terraform",
-            "ansible",
-            "git",
-            "ci/cd",
-            "jenkins",
-            "github actions",
-            "rest",
-            "graphql",
-            "grpc",
-            "microservices",
-            "machine learning",
-            "deep learning",
-            "pytorch",
-            "tensorflow",
-            "data engineering",
-            "spark",
-            "airflow",
-            "kafka",
-            "agile",
-            "scrum",
-            "linux",
-            "unix",
-        ]
-
-        desc_lower = description.lower()
-        found = [kw for kw in keywords if kw in desc_lower]
+        found = find_keywords(description, ATS_TECH_KEYWORDS)
         return found if found else None
 
     def scrape_by_keywords(
@@ -300,6 +239,7 @@ class LeverScraper(BaseScraper):
         # Filter by keywords
         filtered = []
         kw_lower = [k.lower() for k in keywords]
+        location_lower = location.lower() if location else None
         for job in raw_jobs:
             title = (job.get("text") or "").lower()
             desc = (job.get("descriptionPlain") or "").lower()
@@ -307,31 +247,9 @@ class LeverScraper(BaseScraper):
             loc = (categories.get("location") or "").lower()
 
             if any(kw in title or kw in desc for kw in kw_lower):
-                if location and location.lower() not in loc:
+                if location_lower and location_lower not in loc:
                     continue
                 filtered.append(job)
 
-        existing_ids = self._load_existing_ids()
-
-        jobs_added = 0
-        for raw_job in filtered:
-            try:
-                parsed = self._parse_job(raw_job)
-                if parsed.get("source_job_id") in existing_ids:
-                    continue
-                job = self._create_job_object(parsed)
-                self.session.add(job)
-                existing_ids.add(parsed.get("source_job_id"))
-                jobs_added += 1
-            except Exception as e:
-                logger.warning(f"Error parsing Lever job: {e}")
-                continue
-
-        if jobs_added:
-            self.session.commit()
-            try:
-                self._record_metric("jobs_added", jobs_added, None)
-            except Exception:
-                pass
-
-        return jobs_added
+        # Parse, dedupe and bulk-insert the matches in one statement and commit
+        return self._store_raw_jobs(filtered)
@@ -3,10 +3,11 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.html_text import html_to_text
+from src.job_scrapers.tech_keywords import TECH_KEYWORDS, find_keywords
 
 
 class MicrosoftScraper(BaseScraper):
@@ -17,6 +18,7 @@ class MicrosoftScraper(BaseScraper):
 
     MICROSOFT_API = "https://gcsservices.careers.microsoft.com/search/api/v1/search"
     MICROSOFT_CAREERS_URL = "https://careers.microsoft.com/us/en"
+    _APPLY_URL_PREFIX = MICROSOFT_CAREERS_URL + "/jobs/"
 
     def __init__(self, session: Session):
         """Initialize Microsoft careers scraper.
@@ -72,14 +74,9 @@ class MicrosoftScraper(BaseScraper):
             Parsed job data with standardized fields
         """
         # Parse posted date
-        posted_date = datetime.utcnow()
-        if "postingDate" in raw_job:
-            try:
-                posted_date = datetime.fromisoformat(
-                    raw_job["postingDate"].replace("Z", "+00:00")
-                )
-            except (ValueError, TypeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("postingDate")) or datetime.utcnow()
+        )
 
         # Extract description for requirements
         description = self._get_job_description(raw_job)
@@ -103,7 +100,7 @@ class MicrosoftScraper(BaseScraper):
             "description": description,
             "requirements": requirements,
             "nice_to_haves": None,
-            "apply_url": f"{self.MICROSOFT_CAREERS_URL}/jobs/{raw_job.get('jobId')}",
+            "apply_url": self._APPLY_URL_PREFIX + str(raw_job.get("jobId")),
             "posted_date": posted_date,
             "company_industry": "Technology",
             "company_size": "Large Enterprise",
@@ -131,12 +128,13 @@ class MicrosoftScraper(BaseScraper):
         # Join all parts and clean HTML tags if present
         description = " ".join(description_parts)
 
-        # Basic HTML tag removal (Microsoft sometimes includes HTML)
-        try:
-            soup = BeautifulSoup(description, "html.parser")
-            description = soup.get_text()
-        except Exception:
-            pass
+        # Basic HTML tag removal (Microsoft sometimes includes HTML); plain
+        # text skips the parser entirely.
+        if "<" in description:
+            try:
+                description = html_to_text(description)
+            except Exception:
+                pass
 
         return description.strip()
 
@@ -149,46 +147,7 @@ class MicrosoftScraper(BaseScraper):
         Returns:
             List of requirements
         """
-        keywords = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "csharp",
-            "c#",
-            "golang",
-            "rust",
-            "sql",
-            "azure",
-            "aws",
-            "gcp",
-            ".net",
-            "asp.net",
-            "react",
-            "angular",
-            "vue",
-            "node",
-            "express",
-            "docker",
-            "kubernetes",
-            "git",
-            "rest api",
-            "graphql",
-            "microservices",
-            "agile",
-            "scrum",
-            "jira",
-            "linux",
-            "windows server",
-            "postgresql",
-            "sql server",
-            "mongodb",
-            "cosmosdb",
-        ]
-
-        desc_lower = description.lower()
-        found_keywords = [keyword for keyword in keywords if keyword in desc_lower]
+        found_keywords = find_keywords(description, TECH_KEYWORDS)
         return found_keywords if found_keywords else None
 
     def scrape_by_keywords(
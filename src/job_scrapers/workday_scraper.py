@@ -50,6 +50,10 @@ DESCRIPTION_DELAY = 0.1  # seconds
 PAGE_SIZE = 20
 MAX_JOBS_PER_PORTAL = 100
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_POSTED_DAYS_RE = re.compile(r"(\d+)\+?\s+day")
+
 
 @dataclass
 class WorkdayPortal:
@@ -196,7 +200,7 @@ class WorkdayScraper(BaseScraper):
     def __init__(self, session: Session, portals: Optional[List[WorkdayPortal]] = None):
         super().__init__(session)
         self.portals = portals or WORKDAY_PORTALS
-        self._http = requests.Session()
+        self._http = self._new_http_session()
         self._http.headers.update(
             {
                 "Accept": "application/json",
@@ -242,7 +246,7 @@ class WorkdayScraper(BaseScraper):
                 )
                 break
 
-            data = resp.json()
+            data = self._decode_json(resp)
             page = data.get("jobPostings", [])
             if not page:
                 break
@@ -270,7 +274,9 @@ class WorkdayScraper(BaseScraper):
         try:
             resp = self._http.get(url, timeout=15)
             resp.raise_for_status()
-            return resp.json().get("jobPostingInfo", {}).get("jobDescription")
+            return (
+                self._decode_json(resp).get("jobPostingInfo", {}).get("jobDescription")
+            )
         except Exception as e:
             logger.debug(
                 "Could not fetch description for %s %s: %s",
@@ -369,8 +375,8 @@ def _parse_remote(locations_text: str) -> Optional[str]:
 
 
 def _strip_html(html: str) -> str:
-    clean = re.sub(r"<[^>]+>", " ", html)
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _TAG_RE.sub(" ", html)
+    clean = _WHITESPACE_RE.sub(" ", clean).strip()
     return clean
 
 
@@ -382,7 +388,7 @@ def _parse_posted_on(posted_on: str) -> datetime:
     text = posted_on.lower()
     if "today" in text:
         return now
-    match = re.search(r"(\d+)\+?\s+day", text)
+    match = _POSTED_DAYS_RE.search(text)
     if match:
         return now - timedelta(days=int(match.group(1)))
     return now
@@ -100,7 +100,10 @@ def _do_scrape(sns_topic_arn: str, function_name: str) -> Dict[str, Any]:
                 logger.warning("Unknown source: %s", source_name)
                 return source_name, 0, 0, None, None
             scraper = cls(session)
-            jobs = scraper.scrape(max_retries=3, backoff_factor=1.0)
+            try:
+                jobs = scraper.scrape(max_retries=3, backoff_factor=1.0)
+            finally:
+                scraper.close()
             count = len(jobs)
             raw_count = scraper.last_raw_count
             skip_reason = scraper.last_skip_reason
@@ -214,7 +217,7 @@ def _do_match(sns_topic_arn: str) -> Dict[str, Any]:
     from sqlalchemy import exists
 
     from src.database import get_session, init_db
-    from src.job_matcher import compute_match_for_user
+    from src.job_matcher import USER_MATCH_OPTIONS, compute_match_for_user
     from src.models import Job, JobMatch, Skill, User, UserPreferences
 
     init_db()
@@ -234,6 +237,7 @@ def _do_match(sns_topic_arn: str) -> Dict[str, Any]:
         # completed their profile.
         users = (
             session.query(User)
+            .options(*USER_MATCH_OPTIONS)
             .filter(
                 User.cv_text.isnot(None)
                 | exists().where(Skill.user_id == User.id)
@@ -10,15 +10,37 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, matching datetime.utcnow()."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() is in the session TimeZone; convert before dropping the offset
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 class User(Base):
     """User profile with CV data."""
 
@@ -27,7 +49,7 @@ class User(Base):
     id = Column(Integer, primary_key=True)
     google_id = Column(String(255), unique=True, index=True)  # Google OAuth "sub" claim
     email = Column(String(255), unique=True, index=True)
-    name = Column(String(255))
+    name = Column(String(255), index=True)  # profile lookup by CV name
     location = Column(String(255))
     title = Column(String(255))
     cv_text = Column(String)  # Raw CV text
@@ -83,6 +105,10 @@ class Job(Base):
     """Job listing from any source."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_source_source_job_id", "source", "source_job_id", unique=True),
+        Index("ix_jobs_posted_date", "posted_date"),  # search sorts/filters on it
+    )
 
     id = Column(Integer, primary_key=True)
     source = Column(String(50))  # linkedin, glassdoor, github, stackoverflow, etc.
@@ -100,7 +126,10 @@ class Job(Base):
     nice_to_haves = Column(JSON)
     apply_url = Column(String(500))
     posted_date = Column(DateTime)
-    scraped_at = Column(DateTime, default=datetime.utcnow)
+    # Scrapers stamp a whole batch with one timestamp; the server default
+    # covers rows written with raw SQL (migrations, manual fixes), in UTC like
+    # every scraped_at comparison.
+    scraped_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     is_active = Column(Boolean, nullable=False, default=True)
     company_industry = Column(Text)
     company_size = Column(String(50))
@@ -116,6 +145,10 @@ class JobMatch(Base):
     """Job match scoring against user profile."""
 
     __tablename__ = "job_matches"
+    __table_args__ = (
+        # Match listings filter by user and minimum score
+        Index("ix_job_matches_user_id_match_score", "user_id", "match_score"),
+    )
 
     id = Column(Integer, primary_key=True)
     job_id = Column(Integer, ForeignKey("jobs.id"))
@@ -16,6 +16,8 @@ from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 
+from src.database import dispose_engines
+
 logger = logging.getLogger("jobhunter.s3_sync")
 
 _s3_client = None
@@ -57,6 +59,8 @@ def pull() -> bool:
 
     local_path = _local_db_path()
     Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+    # Pooled connections would keep pointing at the file being replaced.
+    dispose_engines()
 
     try:
         _get_s3().download_file(bucket, key, local_path)
@@ -89,6 +93,8 @@ def push() -> bool:
         logger.warning("Local DB not found at %s, skipping push", local_path)
         return False
 
+    # Checkpoint the WAL so the uploaded file contains every committed write.
+    dispose_engines()
     _get_s3().upload_file(local_path, bucket, key)
     logger.info("Pushed %s → s3://%s/%s", local_path, bucket, key)
     return True
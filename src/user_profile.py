@@ -1,10 +1,11 @@
 """User profile management module."""
 
+from pathlib import Path
 from typing import Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
-from src.cv_parser import parse_cv_file
+from src.cv_parser import parse_cv_text
 from src.models import Skill, User, UserPreferences
 
 
@@ -44,11 +45,16 @@ class UserProfile:
             Created or updated User object
 
         Raises:
-            FileNotFoundError: If CV file not found
-            ValueError: If CV parsing fails or required data missing
+            ValueError: If CV file not found, parsing fails or required data
+                missing
         """
-        # Parse CV
-        cv_data = parse_cv_file(cv_file_path)
+        # Read the CV once; the same text is parsed and stored on the user
+        try:
+            cv_text = Path(cv_file_path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise ValueError(f"CV file not found: {cv_file_path}") from None
+
+        cv_data = parse_cv_text(cv_text)
         if not cv_data or not cv_data.get("personal_info", {}).get("name"):
             raise ValueError(f"Failed to parse CV from {cv_file_path}")
 
@@ -61,7 +67,7 @@ class UserProfile:
         user = self.session.query(User).filter_by(name=name).first()
         if user:
             # Update existing user
-            user.cv_text = open(cv_file_path, "r", encoding="utf-8").read()
+            user.cv_text = cv_text
             user.cv_parsed_json = cv_data
             user.title = personal_info.get("title")
             user.location = personal_info.get("location")
@@ -71,7 +77,7 @@ class UserProfile:
                 name=name,
                 title=personal_info.get("title"),
                 location=personal_info.get("location"),
-                cv_text=open(cv_file_path, "r", encoding="utf-8").read(),
+                cv_text=cv_text,
                 cv_parsed_json=cv_data,
             )
             self.session.add(user)
@@ -9,7 +9,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from src.database import get_session
-from src.job_matcher import compute_match_for_user
+from src.job_matcher import USER_MATCH_OPTIONS, compute_match_for_user
 from src.job_scrapers.registry import DEFAULT_SOURCES, SCRAPER_MAP
 from src.models import Job, User
 
@@ -33,7 +33,10 @@ def _scrape_job(source_name: str) -> None:
             return
 
         scraper = cls(session)
-        jobs = scraper.scrape(max_retries=3, backoff_factor=1.0)
+        try:
+            jobs = scraper.scrape(max_retries=3, backoff_factor=1.0)
+        finally:
+            scraper.close()
         logger.info(f"Scraped {len(jobs)} new jobs from {source_name}")
 
     except Exception as e:
@@ -50,10 +53,10 @@ def _match_job(user_id: Optional[int] = None) -> None:
     """
     session = get_session()
     try:
+        query = session.query(User).options(*USER_MATCH_OPTIONS)
         if user_id:
-            users = session.query(User).filter(User.id == user_id).all()
-        else:
-            users = session.query(User).all()
+            query = query.filter(User.id == user_id)
+        users = query.all()
 
         jobs = session.query(Job).all()
 
@@ -0,0 +1,61 @@
+"""Shared pytest fixtures."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from src.database import get_engine, get_session, init_db
+from src.models import Base
+
+_MEMORY_DB_URL = "sqlite:///:memory:"
+
+
+@pytest.fixture(scope="session")
+def memory_db():
+    """Create the schema in a shared in-memory SQLite database, once per run."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", _MEMORY_DB_URL)
+        init_db()
+    return _MEMORY_DB_URL
+
+
+@pytest.fixture
+def temp_db(memory_db, monkeypatch):
+    """Point DATABASE_URL at the in-memory database and empty it afterwards.
+
+    Tables are created once per run rather than per test; each test starts
+    with empty tables instead of a fresh database file.
+    """
+    monkeypatch.setenv("DATABASE_URL", memory_db)
+    engine = get_engine()
+    if not _has_schema(engine):
+        Base.metadata.create_all(engine)
+
+    yield memory_db
+
+    engine = get_engine()
+    if _has_schema(engine):
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+
+def _has_schema(engine) -> bool:
+    # dispose_engines() drops the in-memory database along with its engine
+    return inspect(engine).has_table(Base.metadata.sorted_tables[0].name)
+
+
+@pytest.fixture
+def session(temp_db):
+    """Get database session."""
+    session = get_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def raw_session():
+    """Session stand-in for tests that never reach the database."""
+    return MagicMock(spec=Session)
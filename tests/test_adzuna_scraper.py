@@ -1,36 +1,16 @@
 """Tests for Adzuna job aggregator scraper."""
 
-import tempfile
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from src.database import get_session, init_db
 from src.job_scrapers.adzuna_scraper import AdzunaScraper
 from src.models import Job, UserPreferences
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create Adzuna scraper with test credentials."""
@@ -229,11 +209,11 @@ class TestAdzunaScraper:
         jobs = scraper_no_creds._fetch_jobs()
         assert jobs == []
 
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
+    @patch("src.job_scrapers.adzuna_scraper.requests.Session.get")
     def test_fetch_jobs_success(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_ADZUNA_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_ADZUNA_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs()
@@ -242,54 +222,46 @@ class TestAdzunaScraper:
         assert jobs[0]["_country"] == "gb"
         assert jobs[0]["title"] == "Senior Python Developer"
 
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
-    def test_fetch_jobs_auth_failure(self, mock_get, scraper):
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
-
-        jobs = scraper._fetch_jobs()
-        assert len(jobs) == 0
-
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
-    def test_fetch_jobs_rate_limit(self, mock_get, scraper):
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
-
-        jobs = scraper._fetch_jobs()
-        assert len(jobs) == 0
-
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
-    def test_fetch_jobs_network_error(self, mock_get, scraper):
-        import requests
-
-        mock_get.side_effect = requests.RequestException("Connection timeout")
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            MagicMock(status_code=401),
+            MagicMock(status_code=429),
+            requests.RequestException("Connection timeout"),
+        ],
+        ids=["auth_failure", "rate_limit", "network_error"],
+    )
+    def test_fetch_jobs_failure_returns_empty(self, scraper, outcome):
+        """Auth failures, rate limits and network errors all yield no jobs."""
+        with patch("src.job_scrapers.adzuna_scraper.requests.Session.get") as mock_get:
+            if isinstance(outcome, Exception):
+                mock_get.side_effect = outcome
+            else:
+                mock_get.return_value = outcome
 
-        jobs = scraper._fetch_jobs()
-        assert len(jobs) == 0
+            assert scraper._fetch_jobs() == []
 
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
+    @patch("src.job_scrapers.adzuna_scraper.requests.Session.get")
     def test_fetch_jobs_pagination_stops_on_empty(self, mock_get, scraper):
         """Test pagination stops when no more results."""
         first_response = MagicMock()
         first_response.status_code = 200
-        first_response.json.return_value = SAMPLE_ADZUNA_RESPONSE
+        first_response.content = json.dumps(SAMPLE_ADZUNA_RESPONSE).encode()
 
         empty_response = MagicMock()
         empty_response.status_code = 200
-        empty_response.json.return_value = {"results": []}
+        empty_response.content = json.dumps({"results": []}).encode()
 
         mock_get.side_effect = [first_response, empty_response]
 
         jobs = scraper._fetch_jobs(max_pages=3)
         assert len(jobs) == 2  # Only first page results
 
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
+    @patch("src.job_scrapers.adzuna_scraper.requests.Session.get")
     def test_scrape_persists_jobs(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_ADZUNA_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_ADZUNA_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper.scrape(max_retries=1)
@@ -298,11 +270,11 @@ class TestAdzunaScraper:
         saved = scraper.session.query(Job).filter(Job.source == "adzuna").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.adzuna_scraper.requests.get")
+    @patch("src.job_scrapers.adzuna_scraper.requests.Session.get")
     def test_scrape_deduplicates(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_ADZUNA_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_ADZUNA_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         first = scraper.scrape(max_retries=1)
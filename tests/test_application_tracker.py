@@ -1,33 +1,7 @@
 """Tests for application tracking functionality."""
 
-import tempfile
-
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from src.application_tracker import ApplicationTracker
-from src.models import Base, Job
-
-
-@pytest.fixture
-def session():
-    """Create a test database session."""
-    db_fd, db_path = tempfile.mkstemp()
-    database_url = f"sqlite:///{db_path}"
-
-    engine = create_engine(database_url)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
-    yield session
-
-    session.close()
-    import os
-
-    os.close(db_fd)
-    os.unlink(db_path)
+from src.models import Job
 
 
 def test_save_job(session):
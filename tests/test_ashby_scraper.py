@@ -1,5 +1,6 @@
 """Unit tests for AshbyScraper."""
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -72,17 +73,29 @@ def test_strip_html_none_returns_empty():
 def _make_response(status_code: int, json_data: dict):
     resp = MagicMock()
     resp.status_code = status_code
-    resp.json.return_value = json_data
+    resp.content = json.dumps(json_data).encode()
     return resp
 
 
+def _by_slug(acme, test_co):
+    """side_effect answering per board, since boards are fetched concurrently."""
+
+    def get(url, **kwargs):
+        result = acme if url.endswith("/acme") else test_co
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return get
+
+
 def test_fetch_jobs_success(scraper):
     job = {"id": "j1", "title": "Engineer", "isListed": True}
-    responses = [
+    responses = _by_slug(
         _make_response(200, {"jobs": [job]}),
         _make_response(200, {"jobs": []}),
-    ]
-    with patch("requests.get", side_effect=responses):
+    )
+    with patch("requests.Session.get", side_effect=responses):
         jobs = scraper._fetch_jobs()
 
     assert len(jobs) == 1
@@ -94,11 +107,11 @@ def test_fetch_jobs_skips_unlisted(scraper):
         {"id": "j1", "title": "Listed", "isListed": True},
         {"id": "j2", "title": "Unlisted", "isListed": False},
     ]
-    responses = [
+    responses = _by_slug(
         _make_response(200, {"jobs": jobs}),
         _make_response(200, {"jobs": []}),
-    ]
-    with patch("requests.get", side_effect=responses):
+    )
+    with patch("requests.Session.get", side_effect=responses):
         result = scraper._fetch_jobs()
 
     assert len(result) == 1
@@ -106,11 +119,11 @@ def test_fetch_jobs_skips_unlisted(scraper):
 
 
 def test_fetch_jobs_404_skips_board(scraper):
-    responses = [
+    responses = _by_slug(
         _make_response(404, {}),
         _make_response(200, {"jobs": [{"id": "j2", "isListed": True}]}),
-    ]
-    with patch("requests.get", side_effect=responses):
+    )
+    with patch("requests.Session.get", side_effect=responses):
         result = scraper._fetch_jobs()
 
     assert len(result) == 1
@@ -118,11 +131,11 @@ def test_fetch_jobs_404_skips_board(scraper):
 
 
 def test_fetch_jobs_non_200_skips_board(scraper):
-    responses = [
+    responses = _by_slug(
         _make_response(500, {}),
         _make_response(200, {"jobs": [{"id": "j2", "isListed": True}]}),
-    ]
-    with patch("requests.get", side_effect=responses):
+    )
+    with patch("requests.Session.get", side_effect=responses):
         result = scraper._fetch_jobs()
 
     assert len(result) == 1
@@ -130,11 +143,11 @@ def test_fetch_jobs_non_200_skips_board(scraper):
 
 def test_fetch_jobs_request_exception_skips_board(scraper):
     with patch(
-        "requests.get",
-        side_effect=[
+        "requests.Session.get",
+        side_effect=_by_slug(
             requests.RequestException("timeout"),
             _make_response(200, {"jobs": []}),
-        ],
+        ),
     ):
         result = scraper._fetch_jobs()
 
@@ -143,7 +156,7 @@ def test_fetch_jobs_request_exception_skips_board(scraper):
 
 def test_fetch_jobs_board_slugs_override(scraper):
     with patch(
-        "requests.get", return_value=_make_response(200, {"jobs": []})
+        "requests.Session.get", return_value=_make_response(200, {"jobs": []})
     ) as mock_get:
         scraper._fetch_jobs(board_slugs=["override"])
 
@@ -1,25 +1,11 @@
 """Tests for CLI interface."""
 
-import os
-import tempfile
-
 import pytest
 from click.testing import CliRunner
 
 from src.cli import cli
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test.db")
-        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
-        yield db_path
-        if os.path.exists(db_path):
-            os.remove(db_path)
-
-
 @pytest.fixture
 def cli_runner():
     """Create CLI runner."""
@@ -87,6 +73,31 @@ def test_profile_upload(temp_db, cli_runner, sample_cv_file):
     assert "John Doe" in result.output
 
 
+def test_profile_upload_splits_comma_separated_titles(
+    temp_db, cli_runner, sample_cv_file
+):
+    """Comma-separated and repeated --titles values are merged into one list."""
+    cli_runner.invoke(cli, ["init"])
+
+    result = cli_runner.invoke(
+        cli,
+        [
+            "profile",
+            "upload",
+            sample_cv_file,
+            "--titles",
+            "Software Engineer, Staff Engineer,",
+            "--titles",
+            "Senior Engineer",
+        ],
+    )
+    assert result.exit_code == 0, f"Exit code {result.exit_code}: {result.output}"
+    assert (
+        "Target Titles: Software Engineer, Staff Engineer, Senior Engineer"
+        in result.output
+    )
+
+
 def test_profile_show(temp_db, cli_runner, sample_cv_file):
     """Test profile show command."""
     # Initialize and upload
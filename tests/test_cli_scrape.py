@@ -24,6 +24,9 @@ def test_scrape_cli_monkeypatched(monkeypatch, tmp_path):
         def scrape_by_keywords(self, keywords):
             return 0
 
+        def close(self):
+            pass
+
     # Patch the names as bound in src.cli (not the registry originals), because
     # src.cli may already be cached and holds its own references via
     # `from src.job_scrapers.registry import SCRAPER_MAP, DEFAULT_SOURCES`.
@@ -1,11 +1,25 @@
 """Tests for CV parser."""
 
+from types import MappingProxyType
+
 import pytest
 
-from src.cv_parser import CVParser, parse_cv_file
+from src.cv_parser import CVParser, parse_cv_file, parse_cv_text
+
+# What the sample CV's header parses to; the placeholder email and phone
+# are not valid contact details, so they come back as None.
+_EXPECTED_PERSONAL_INFO = MappingProxyType(
+    {
+        "name": "Peter Boucher",
+        "email": None,
+        "phone": None,
+        "location": "C/ Los Naranjos 66, Secadero, Casares 29692, Málaga, Spain",
+        "title": "Innovation Lead",
+    }
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cv():
     """Sample CV text for testing."""
     return """# Peter Boucher
@@ -76,43 +90,48 @@ architecture, quality assurance, and digital transformation.
 """
 
 
-def test_extract_name(sample_cv):
+@pytest.fixture(scope="module")
+def parser(sample_cv):
+    """Parser over the sample CV, shared by the module's tests."""
+    return CVParser(sample_cv)
+
+
+@pytest.fixture(scope="module")
+def parsed_cv(parser):
+    """The sample CV parsed once for the module."""
+    return parser.parse()
+
+
+def test_extract_name(parser):
     """Test name extraction."""
-    parser = CVParser(sample_cv)
-    name = parser._extract_name()
-    assert name == "Peter Boucher"
+    assert parser._extract_name() == _EXPECTED_PERSONAL_INFO["name"]
 
 
-def test_extract_title(sample_cv):
+def test_extract_title(parser):
     """Test title extraction."""
-    parser = CVParser(sample_cv)
-    title = parser._extract_title()
-    assert title == "Innovation Lead"
+    assert parser._extract_title() == _EXPECTED_PERSONAL_INFO["title"]
 
 
-def test_extract_location(sample_cv):
+def test_extract_location(parser):
     """Test location extraction."""
-    parser = CVParser(sample_cv)
     location = parser._extract_location()
     # Should find location if present, but may be None if format varies
     if location:
         assert isinstance(location, str)
 
 
-def test_parse_skills(sample_cv):
+def test_parse_skills(parsed_cv):
     """Test skills parsing."""
-    parser = CVParser(sample_cv)
-    skills = parser._parse_skills()
+    skills = parsed_cv["skills"]
     assert isinstance(skills, dict)
     # Skills dict should have the expected keys
     assert "technical" in skills
     assert "soft" in skills
 
 
-def test_parse_experience(sample_cv):
+def test_parse_experience(parsed_cv):
     """Test experience parsing."""
-    parser = CVParser(sample_cv)
-    exp = parser._parse_experience()
+    exp = parsed_cv["experience"]
     # Experience can be empty list if format doesn't match
     assert isinstance(exp, list)
     # Check if we found any entries
@@ -120,36 +139,30 @@ def test_parse_experience(sample_cv):
         assert any("Maersk" in e.get("company", "") for e in exp)
 
 
-def test_parse_education(sample_cv):
+def test_parse_education(parsed_cv):
     """Test education parsing."""
-    parser = CVParser(sample_cv)
-    edu = parser._parse_education()
     # Education can be empty list if format doesn't match
-    assert isinstance(edu, list)
+    assert isinstance(parsed_cv["education"], list)
 
 
-def test_parse_languages(sample_cv):
+def test_parse_languages(parsed_cv):
     """Test languages parsing."""
-    parser = CVParser(sample_cv)
-    langs = parser._parse_languages()
+    langs = parsed_cv["languages"]
     assert len(langs) > 0
     langs_text = " ".join(langs).lower()
     assert "english" in langs_text or "spanish" in langs_text
 
 
-def test_full_parse(sample_cv):
+def test_full_parse(parsed_cv):
     """Test full CV parsing."""
-    parser = CVParser(sample_cv)
-    result = parser.parse()
+    result = parsed_cv
 
     assert "personal_info" in result
     assert "experience" in result
     assert "education" in result
     assert "skills" in result
 
-    # Verify personal info
-    assert result["personal_info"]["name"] == "Peter Boucher"
-    assert result["personal_info"]["title"] == "Innovation Lead"
+    assert result["personal_info"] == _EXPECTED_PERSONAL_INFO
 
     # Verify these are lists/dicts (may be empty due to format variations)
     assert isinstance(result["experience"], list)
@@ -168,7 +181,75 @@ def test_parse_cv_file(tmp_path):
     assert result["personal_info"]["title"] == "Test Role"
 
 
+def test_parse_cv_text_matches_parse_cv_file(tmp_path):
+    """Parsing text in memory gives the same result as parsing the file."""
+    cv_content = "# Test User\n\n## Contact Information\n- **Title**: Test Role"
+    cv_file = tmp_path / "test_cv.md"
+    cv_file.write_text(cv_content)
+
+    assert parse_cv_text(cv_content) == parse_cv_file(str(cv_file))
+
+
 def test_parse_cv_file_not_found():
     """Test parsing non-existent file."""
     result = parse_cv_file("/nonexistent/cv.md")
     assert result == {}
+
+
+def test_parse_section_alternatives():
+    """Either header listed for a text section is found."""
+    cv = "# A Person\n\n## Certifications\n- AWS SAA\n\n## Projects\n- Thing\n"
+    result = CVParser(cv).parse()
+    assert result["certifications"] == "AWS SAA"
+    assert result["projects"] == "Thing"
+
+    cv = "# A Person\n\n## Awards & Recognition\n- Award\n"
+    assert CVParser(cv).parse()["certifications"] == "Award"
+
+
+def test_parse_languages_falls_back_to_skills():
+    """Without a Languages section, languages come from the skills subsection."""
+    cv = "## Skills\n\n### Technical\n- Python\n\n### Languages\n- Catalan\n"
+    assert CVParser(cv)._parse_languages() == ["Catalan"]
+
+
+def test_parse_experience_metadata(parsed_cv):
+    """Location and duration are split out of the shared metadata line."""
+    exp = parsed_cv["experience"]
+    assert exp[0]["location"] == "Algeciras"
+    assert exp[0]["duration"] == "Apr 2022 - Dec 2025"
+
+
+def test_parse_experience_ignores_bullets_mentioning_location():
+    cv = (
+        "## Experience\n\n### Acme | Engineer\n**Location**: Leeds\n\n"
+        "- Built a location-aware routing service\n"
+    )
+    exp = CVParser(cv)._parse_experience()
+    assert exp[0]["location"] == "Leeds"
+    assert exp[0]["duration"] is None
+
+
+def test_personal_info_from_single_line_contact_row():
+    """Location stops at "|" so email and phone on the same line are found."""
+    cv = (
+        "# A Person\n\n## Contact\n"
+        "- **Location**: London, UK | **Email**: jane@example.com"
+        " | **Phone**: +44 7700 900123\n"
+    )
+    info = CVParser(cv)._parse_personal_info()
+    assert info["location"] == "London, UK"
+    assert info["email"] == "jane@example.com"
+    assert info["phone"] == "+44 7700 900123"
+
+
+def test_personal_info_found_after_long_summary():
+    """Contact fields beyond the CV head are still found."""
+    filler = "- Delivered projects on time\n" * 100
+    cv = (
+        f"# A Person\n\n## Summary\n{filler}\n"
+        "## Contact\n- **Location**: Leeds\n- **Email**: me@example.com\n"
+    )
+    info = CVParser(cv)._parse_personal_info()
+    assert info["location"] == "Leeds"
+    assert info["email"] == "me@example.com"
@@ -2,38 +2,14 @@
 
 import csv
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from src.data_exporter import DataExporter
-from src.models import Application, Base, Job
+from src.models import Application, Job
 
 
-@pytest.fixture
-def session():
-    """Create a test database session."""
-    db_fd, db_path = tempfile.mkstemp()
-    database_url = f"sqlite:///{db_path}"
-
-    engine = create_engine(database_url)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
-    yield session
-
-    session.close()
-    import os
-
-    os.close(db_fd)
-    os.unlink(db_path)
-
-
-def test_export_jobs_to_json(session):
+def test_export_jobs_to_json(session, tmp_path):
     """Test exporting jobs to JSON."""
     # Create test jobs
     job1 = Job(
@@ -55,24 +31,19 @@ def test_export_jobs_to_json(session):
     session.commit()
 
     exporter = DataExporter(session)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        filepath = f.name
-
-    try:
-        exporter.export_jobs_json([job1, job2], filepath)
+    filepath = tmp_path / "export.json"
 
-        # Verify file contents
-        with open(filepath) as f:
-            data = json.load(f)
+    exporter.export_jobs_json([job1, job2], filepath)
 
-        assert len(data) == 2
-        assert data[0]["title"] == "Python Dev"
+    # Verify file contents
+    with open(filepath) as f:
+        data = json.load(f)
 
-    finally:
-        Path(filepath).unlink()
+    assert len(data) == 2
+    assert data[0]["title"] == "Python Dev"
 
 
-def test_export_jobs_to_csv(session):
+def test_export_jobs_to_csv(session, tmp_path):
     """Test exporting jobs to CSV."""
     job = Job(
         source="test",
@@ -85,29 +56,25 @@ def test_export_jobs_to_csv(session):
     )
     session.add(job)
     session.commit()
+    session.refresh(job)  # export the stored values, as the CLI does
 
     exporter = DataExporter(session)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-        filepath = f.name
-
-    try:
-        exporter.export_jobs_csv([job], filepath)
+    filepath = tmp_path / "export.csv"
 
-        # Verify file contents
-        with open(filepath) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+    exporter.export_jobs_csv([job], filepath)
 
-        assert len(rows) == 1
-        assert rows[0]["title"] == "Test Job"
-        assert rows[0]["company"] == "TestCorp"
-        assert rows[0]["salary_min"] == "100000.0"
+    # Verify file contents
+    with open(filepath) as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
 
-    finally:
-        Path(filepath).unlink()
+    assert len(rows) == 1
+    assert rows[0]["title"] == "Test Job"
+    assert rows[0]["company"] == "TestCorp"
+    assert rows[0]["salary_min"] == "100000.0"
 
 
-def test_export_applications_to_json(session):
+def test_export_applications_to_json(session, tmp_path):
     """Test exporting applications to JSON."""
     # Create a job and application
     job = Job(source="test", source_job_id="1", title="Test Job", company="Corp")
@@ -119,54 +86,40 @@ def test_export_applications_to_json(session):
     session.commit()
 
     exporter = DataExporter(session)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        filepath = f.name
+    filepath = tmp_path / "export.json"
 
-    try:
-        exporter.export_applications_json([app], filepath)
+    exporter.export_applications_json([app], filepath)
 
-        with open(filepath) as f:
-            data = json.load(f)
+    with open(filepath) as f:
+        data = json.load(f)
 
-        assert len(data) == 1
-        assert data[0]["status"] == "applied"
-        assert data[0]["job_title"] == "Test Job"
+    assert len(data) == 1
+    assert data[0]["status"] == "applied"
+    assert data[0]["job_title"] == "Test Job"
 
-    finally:
-        Path(filepath).unlink()
 
-
-def test_export_empty_jobs(session):
+def test_export_empty_jobs(session, tmp_path):
     """Test that exporting empty jobs raises error."""
     exporter = DataExporter(session)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        filepath = f.name
+    filepath = tmp_path / "export.json"
 
-    try:
-        with pytest.raises(ValueError, match="No jobs to export"):
-            exporter.export_jobs_json([], filepath)
-    finally:
-        Path(filepath).unlink()
+    with pytest.raises(ValueError, match="No jobs to export"):
+        exporter.export_jobs_json([], filepath)
 
 
-def test_export_with_auto_format(session):
+def test_export_with_auto_format(session, tmp_path):
     """Test export with auto-format detection."""
     job = Job(source="test", source_job_id="1", title="Test Job", company="Corp")
     session.add(job)
     session.commit()
 
     exporter = DataExporter(session)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        filepath = f.name
-
-    try:
-        exporter.export_to_file([job], filepath, data_type="jobs", format="json")
+    filepath = tmp_path / "export.json"
 
-        with open(filepath) as f:
-            data = json.load(f)
+    exporter.export_to_file([job], filepath, data_type="jobs", format="json")
 
-        assert len(data) == 1
-        assert data[0]["title"] == "Test Job"
+    with open(filepath) as f:
+        data = json.load(f)
 
-    finally:
-        Path(filepath).unlink()
+    assert len(data) == 1
+    assert data[0]["title"] == "Test Job"
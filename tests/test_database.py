@@ -1,51 +1,41 @@
 """Tests for database module."""
 
 import os
-import tempfile
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql, sqlite
 
-from src.database import create_engine_instance, get_database_url, get_session, init_db
-from src.models import Job, Skill, User, UserPreferences
+from src.database import (
+    create_engine_instance,
+    dispose_engines,
+    get_database_url,
+    get_engine,
+    get_session,
+    init_db,
+)
+from src.models import Base, Job, Skill, User, UserPreferences
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path, monkeypatch):
     """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test.db")
-        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
-        yield db_path
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    db_path = str(tmp_path / "test.db")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    return db_path
 
 
-def test_get_database_url_from_env():
+def test_get_database_url_from_env(monkeypatch):
     """Test getting database URL from environment."""
-    original = os.environ.get("DATABASE_URL")
-    try:
-        os.environ["DATABASE_URL"] = "sqlite:///test.db"
-        url = get_database_url()
-        assert url == "sqlite:///test.db"
-    finally:
-        if original:
-            os.environ["DATABASE_URL"] = original
-        else:
-            os.environ.pop("DATABASE_URL", None)
-
-
-def test_get_database_url_default():
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///test.db")
+    assert get_database_url() == "sqlite:///test.db"
+
+
+def test_get_database_url_default(monkeypatch):
     """Test getting default database URL."""
-    original = os.environ.get("DATABASE_URL")
-    try:
-        os.environ.pop("DATABASE_URL", None)
-        url = get_database_url()
-        assert "jobs.db" in url
-    finally:
-        if original:
-            os.environ["DATABASE_URL"] = original
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    assert "jobs.db" in get_database_url()
 
 
 def test_init_db(temp_db):
@@ -100,7 +90,9 @@ def test_create_user(temp_db):
     session.add(user)
     session.commit()
 
-    retrieved = session.query(User).filter_by(name="Test User").first()
+    # A second session reads the committed row rather than the identity map
+    with get_session() as other:
+        retrieved = other.get(User, user.id)
     assert retrieved is not None
     assert retrieved.name == "Test User"
     assert retrieved.location == "Test City"
@@ -118,7 +110,7 @@ def test_create_user_preferences(temp_db):
         title="Engineer",
     )
     session.add(user)
-    session.commit()
+    session.flush()  # assigns user.id without a separate commit
 
     prefs = UserPreferences(
         user_id=user.id,
@@ -128,7 +120,8 @@ def test_create_user_preferences(temp_db):
     session.add(prefs)
     session.commit()
 
-    retrieved = session.query(UserPreferences).filter_by(user_id=user.id).first()
+    with get_session() as other:
+        retrieved = other.get(UserPreferences, prefs.id)
     assert retrieved is not None
     assert "Software Engineer" in retrieved.target_titles
 
@@ -142,7 +135,7 @@ def test_create_skill(temp_db):
 
     user = User(name="Test User")
     session.add(user)
-    session.commit()
+    session.flush()
 
     skill = Skill(
         user_id=user.id,
@@ -153,7 +146,8 @@ def test_create_skill(temp_db):
     session.add(skill)
     session.commit()
 
-    retrieved = session.query(Skill).filter_by(skill_name="Python").first()
+    with get_session() as other:
+        retrieved = other.get(Skill, skill.id)
     assert retrieved is not None
     assert retrieved.proficiency == 4
 
@@ -169,7 +163,9 @@ def test_postgresql_engine_has_keepalives():
     psycopg2.OperationalError: SSL connection has been closed unexpectedly.
     """
     with patch.dict(os.environ, {"DATABASE_URL": "postgresql://user:pw@host/db"}):
-        with patch("src.database.create_engine") as mock_create:
+        with patch.dict("src.database._ENGINES", clear=True), patch(
+            "src.database.create_engine"
+        ) as mock_create:
             mock_create.return_value = mock_create  # avoid real connection
             create_engine_instance()
 
@@ -184,7 +180,9 @@ def test_postgresql_engine_has_keepalives():
 def test_postgresql_engine_has_pool_pre_ping():
     """PostgreSQL engine must have pool_pre_ping to detect stale connections."""
     with patch.dict(os.environ, {"DATABASE_URL": "postgresql://user:pw@host/db"}):
-        with patch("src.database.create_engine") as mock_create:
+        with patch.dict("src.database._ENGINES", clear=True), patch(
+            "src.database.create_engine"
+        ) as mock_create:
             mock_create.return_value = mock_create
             create_engine_instance()
 
@@ -199,10 +197,21 @@ def test_get_session_uses_engine_with_pre_ping(temp_db):
     pool_pre_ping and keepalive settings, causing SSL errors on Neon.
     """
     init_db()
-    with patch("src.database.create_engine_instance") as mock_factory:
-        mock_factory.side_effect = create_engine_instance
-        get_session()
-        mock_factory.assert_called_once()
+    session = get_session()
+    assert session.get_bind() is create_engine_instance()
+    session.close()
+
+
+def test_engine_is_cached_per_url(temp_db):
+    """Repeated calls share one engine until DATABASE_URL changes."""
+    engine = get_engine()
+    assert get_engine() is engine
+    assert create_engine_instance() is engine
+
+    with patch.dict(os.environ, {"DATABASE_URL": "sqlite:///other.db"}):
+        assert get_engine() is not engine
+
+    assert get_engine() is engine
 
 
 def test_sqlite_engine_has_no_keepalives(temp_db):
@@ -236,3 +245,62 @@ def test_create_job(temp_db):
     assert retrieved.company == "Test Corp"
 
     session.close()
+
+
+def test_scraped_at_server_default_is_utc():
+    """Rows inserted without scraped_at are stamped in UTC on every backend."""
+    column = Job.__table__.c.scraped_at
+    assert (
+        str(column.server_default.arg.compile(dialect=postgresql.dialect()))
+        == "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+    )
+    assert (
+        str(column.server_default.arg.compile(dialect=sqlite.dialect()))
+        == "CURRENT_TIMESTAMP"
+    )
+
+
+def test_sqlite_engine_uses_wal(temp_db):
+    """File-backed SQLite connections run in WAL mode with relaxed sync."""
+    init_db()
+    with create_engine_instance().connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
+def test_in_memory_sqlite_shares_one_connection():
+    """In-memory SQLite must keep tables visible across sessions."""
+    with patch.dict(os.environ, {"DATABASE_URL": "sqlite:///:memory:"}):
+        with patch.dict("src.database._ENGINES", clear=True), patch.dict(
+            "src.database._SESSION_FACTORIES", clear=True
+        ):
+            init_db()
+            session = get_session()
+            session.add(User(name="Memory User"))
+            session.commit()
+            session.close()
+
+            other = get_session()
+            assert other.query(User).filter_by(name="Memory User").count() == 1
+            other.close()
+
+
+def test_init_db_creates_schema_once_per_engine(temp_db, monkeypatch):
+    """Repeat init_db() calls skip create_all until the engines are disposed."""
+    calls = []
+    monkeypatch.setattr(Base.metadata, "create_all", lambda bind: calls.append(bind))
+
+    init_db()
+    init_db()
+    assert len(calls) == 1
+
+    dispose_engines()
+    init_db()
+    assert len(calls) == 2
+
+
+def test_dispose_engines_clears_cache(temp_db):
+    """dispose_engines() drops cached engines so the next call rebuilds."""
+    engine = get_engine()
+    dispose_engines()
+    assert get_engine() is not engine
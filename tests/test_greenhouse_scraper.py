@@ -1,36 +1,15 @@
 """Tests for Greenhouse job board scraper."""
 
-import tempfile
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.database import get_session, init_db
 from src.job_scrapers.greenhouse_scraper import GreenhouseScraper
 from src.models import Job
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create Greenhouse scraper with a small set of boards."""
@@ -117,12 +96,12 @@ class TestGreenhouseScraper:
         assert parsed["posted_date"].year == 2025
         assert parsed["posted_date"].month == 12
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_fetch_jobs_success(self, mock_get, scraper):
         """Test successful job fetching from Greenhouse API."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_GREENHOUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs()
@@ -131,7 +110,7 @@ class TestGreenhouseScraper:
         assert jobs[0]["_board_token"] == "testcompany"
         assert jobs[0]["title"] == "Senior Software Engineer"
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_fetch_jobs_404(self, mock_get, scraper):
         """Test handling of 404 (board not found)."""
         mock_response = MagicMock()
@@ -142,7 +121,7 @@ class TestGreenhouseScraper:
 
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_fetch_jobs_network_error(self, mock_get, scraper):
         """Test handling of network errors."""
         import requests
@@ -153,12 +132,12 @@ class TestGreenhouseScraper:
 
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_scrape_persists_jobs(self, mock_get, scraper):
         """Test that scrape() persists jobs to database."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_GREENHOUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper.scrape(max_retries=1)
@@ -169,12 +148,12 @@ class TestGreenhouseScraper:
         saved = scraper.session.query(Job).filter(Job.source == "greenhouse").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_scrape_deduplicates(self, mock_get, scraper):
         """Test that scraping twice doesn't create duplicates."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_GREENHOUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         first = scraper.scrape(max_retries=1)
@@ -186,18 +165,69 @@ class TestGreenhouseScraper:
         saved = scraper.session.query(Job).filter(Job.source == "greenhouse").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.greenhouse_scraper.requests.get")
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
+    def test_rescrape_skips_parsing_stored_jobs(self, mock_get, scraper):
+        """Jobs already stored are recognised by id without being parsed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
+        mock_get.return_value = mock_response
+
+        scraper.scrape(max_retries=1)
+        with patch.object(scraper, "_parse_job") as parse_job:
+            assert scraper.scrape(max_retries=1) == []
+
+        parse_job.assert_not_called()
+
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
     def test_scrape_by_keywords(self, mock_get, scraper):
         """Test keyword filtering."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_GREENHOUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         count = scraper.scrape_by_keywords(["software engineer"])
 
         assert count == 1  # Only the "Senior Software Engineer" matches
 
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
+    def test_scrape_by_keywords_skips_stored_jobs(self, mock_get, scraper):
+        """A repeat keyword scrape inserts nothing new."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
+        mock_get.return_value = mock_response
+
+        keywords = ["software engineer", "product manager"]
+        assert scraper.scrape_by_keywords(keywords) == 2
+        assert scraper.scrape_by_keywords(keywords) == 0
+
+        saved = scraper.session.query(Job).filter(Job.source == "greenhouse").all()
+        assert len(saved) == 2
+
+    @patch("src.job_scrapers.greenhouse_scraper.requests.Session.get")
+    def test_scrape_by_keywords_skips_unbuildable_rows(self, mock_get, scraper):
+        """A job whose row can't be built is skipped; the rest are inserted."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(SAMPLE_GREENHOUSE_RESPONSE).encode()
+        mock_get.return_value = mock_response
+
+        job_row = scraper._job_row
+
+        def failing_job_row(parsed, **kwargs):
+            if parsed["source_job_id"] == "12345":
+                raise TypeError("bad description")
+            return job_row(parsed, **kwargs)
+
+        keywords = ["software engineer", "product manager"]
+        with patch.object(scraper, "_job_row", side_effect=failing_job_row):
+            assert scraper.scrape_by_keywords(keywords) == 1
+
+        saved = scraper.session.query(Job).filter(Job.source == "greenhouse").all()
+        assert [job.source_job_id for job in saved] == ["67890"]
+
     def test_extract_requirements(self, scraper):
         """Test requirement extraction from description text."""
         description = (
@@ -0,0 +1,23 @@
+"""Tests for HTML-to-text conversion of job descriptions."""
+
+from src.job_scrapers.html_text import html_to_text
+
+
+def test_strips_tags_and_joins_with_separator():
+    html = "<ul><li>Python</li><li>AWS &amp; GCP</li></ul>"
+    assert html_to_text(html, separator="\n") == "Python\nAWS & GCP"
+
+
+def test_drops_scripts_styles_and_comments():
+    html = "<style>p{}</style><p>Build</p><!-- note --><script>x=1</script> it"
+    assert html_to_text(html) == "Build it"
+
+
+def test_empty_and_comment_only_input():
+    assert html_to_text("") == ""
+    assert html_to_text("   ") == ""
+    assert html_to_text("<!-- only -->") == ""
+
+
+def test_plain_text_passes_through():
+    assert html_to_text("No markup here") == "No markup here"
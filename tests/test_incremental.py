@@ -59,9 +59,6 @@ def test_simple_notifier_high_matches(tmp_path, monkeypatch):
     user = User(name="Alice")
     prefs = UserPreferences(salary_min=80000)
     user.preferences = prefs
-    session.add(user)
-    session.commit()
-
     job = Job(
         source="github",
         source_job_id="job-1",
@@ -69,8 +66,8 @@ def test_simple_notifier_high_matches(tmp_path, monkeypatch):
         company="Acme",
         location="SF",
     )
-    session.add(job)
-    session.commit()
+    session.add_all([user, job])
+    session.flush()  # assigns the ids the match refers to
 
     # Create high-match
     match = JobMatch(job_id=job.id, user_id=user.id, match_score=85.0)
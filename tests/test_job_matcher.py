@@ -1,7 +1,7 @@
 import pytest
 
 from src.database import get_session, init_db
-from src.job_matcher import compute_match_for_user
+from src.job_matcher import USER_MATCH_OPTIONS, compute_match_for_user
 from src.models import Job, Skill, User, UserPreferences
 
 
@@ -29,10 +29,6 @@ def test_basic_match(session_tmp):
     )
     user.preferences = prefs
     skill = Skill(skill_name="python", proficiency=8, user=user)
-    session.add(user)
-    session.add(skill)
-    session.commit()
-
     job = Job(
         title="Senior Backend Engineer",
         company="Acme",
@@ -41,7 +37,7 @@ def test_basic_match(session_tmp):
         salary_min=120000,
         requirements=["Python", "Django", "APIs"],
     )
-    session.add(job)
+    session.add_all([user, skill, job])
     session.commit()
 
     jm = compute_match_for_user(session, job, user)
@@ -50,6 +46,22 @@ def test_basic_match(session_tmp):
     assert jm.job_id == job.id
 
 
+def test_user_match_options_preload_relations(session_tmp):
+    """Users loaded for matching already carry preferences and skills."""
+    session = session_tmp
+    for name in ("Alice", "Bob"):
+        user = User(name=name, preferences=UserPreferences(target_titles=["Dev"]))
+        session.add(Skill(skill_name="python", user=user))
+    session.commit()
+    session.expunge_all()
+
+    users = session.query(User).options(*USER_MATCH_OPTIONS).all()
+    session.close()  # a lazy load would now fail
+
+    assert [u.preferences.target_titles for u in users] == [["Dev"], ["Dev"]]
+    assert [len(u.skills) for u in users] == [1, 1]
+
+
 def test_upsert_does_not_create_duplicate_rows(session_tmp):
     """Calling compute_match_for_user twice must update the row, not insert a new one.
 
@@ -58,11 +70,8 @@ def test_upsert_does_not_create_duplicate_rows(session_tmp):
     """
     session = session_tmp
     user = User(name="Bob")
-    session.add(user)
-    session.commit()
-
     job = Job(title="Engineer", company="Co", source="test")
-    session.add(job)
+    session.add_all([user, job])
     session.commit()
 
     from src.models import JobMatch
@@ -92,9 +101,6 @@ def test_upsert_updates_score_on_second_call(session_tmp):
         remote_preference="remote",
     )
     user.preferences = prefs
-    session.add(user)
-    session.commit()
-
     job = Job(
         title="Backend Engineer",
         company="Co",
@@ -102,7 +108,7 @@ def test_upsert_updates_score_on_second_call(session_tmp):
         remote="remote",
         requirements=["Python", "SQL"],
     )
-    session.add(job)
+    session.add_all([user, job])
     session.commit()
 
     # First call — no skills yet, score will be low
@@ -1,36 +1,15 @@
 """Tests for Lever job board scraper."""
 
-import tempfile
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.database import get_session, init_db
 from src.job_scrapers.lever_scraper import LeverScraper
 from src.models import Job
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create Lever scraper with a small set of companies."""
@@ -165,12 +144,12 @@ class TestLeverScraper:
         assert "machine learning" in parsed["requirements"]
         assert "pytorch" in parsed["requirements"]
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_fetch_jobs_success(self, mock_get, scraper):
         """Test successful job fetching from Lever API."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_LEVER_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_LEVER_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs()
@@ -179,7 +158,7 @@ class TestLeverScraper:
         assert jobs[0]["_company_slug"] == "testco"
         assert jobs[0]["text"] == "Backend Engineer"
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_fetch_jobs_404(self, mock_get, scraper):
         """Test handling of 404 (company not found)."""
         mock_response = MagicMock()
@@ -190,7 +169,7 @@ class TestLeverScraper:
 
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_fetch_jobs_network_error(self, mock_get, scraper):
         """Test handling of network errors."""
         import requests
@@ -201,12 +180,12 @@ class TestLeverScraper:
 
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_scrape_persists_jobs(self, mock_get, scraper):
         """Test that scrape() persists jobs to database."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_LEVER_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_LEVER_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper.scrape(max_retries=1)
@@ -216,12 +195,12 @@ class TestLeverScraper:
         saved = scraper.session.query(Job).filter(Job.source == "lever").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_scrape_deduplicates(self, mock_get, scraper):
         """Test that scraping twice doesn't create duplicates."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_LEVER_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_LEVER_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         first = scraper.scrape(max_retries=1)
@@ -233,12 +212,12 @@ class TestLeverScraper:
         saved = scraper.session.query(Job).filter(Job.source == "lever").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.lever_scraper.requests.get")
+    @patch("src.job_scrapers.lever_scraper.requests.Session.get")
     def test_scrape_by_keywords(self, mock_get, scraper):
         """Test keyword filtering."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_LEVER_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_LEVER_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         count = scraper.scrape_by_keywords(["data scientist"])
@@ -275,6 +254,17 @@ class TestLeverScraper:
         assert reqs is not None
         assert len(reqs) == 3
 
+    def test_extract_requirements_from_lists_dedupes(self, scraper):
+        """A line repeated across requirement sections is kept once."""
+        raw_job = {
+            "lists": [
+                {"text": "Requirements", "content": "5+ years Python\nStrong SQL"},
+                {"text": "Qualifications", "content": "5+ years Python\nGood AWS"},
+            ]
+        }
+        reqs = scraper._extract_requirements_from_lists(raw_job)
+        assert reqs == ["5+ years Python", "Strong SQL", "Good AWS"]
+
     def test_extract_requirements_from_lists_empty(self, scraper):
         """Test structured list extraction with no requirement sections."""
         raw_job = {
@@ -1,36 +1,14 @@
 """Tests for LinkedIn job board scraper."""
 
-import tempfile
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.database import get_session, init_db
 from src.job_scrapers.linkedin_scraper import LinkedInScraper
 from src.models import Job
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create LinkedIn scraper with a single search term."""
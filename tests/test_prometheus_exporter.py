@@ -58,7 +58,7 @@ def test_prometheus_cli_command():
     # Mock prometheus_client.start_http_server
     mock_http_server = MagicMock()
     with patch("prometheus_client.start_http_server", mock_http_server):
-        with patch("src.cli.create_exporter"):
+        with patch("src.prometheus_exporter.create_exporter"):
             # Simulate Ctrl+C
             with patch("time.sleep", side_effect=KeyboardInterrupt()):
                 result = runner.invoke(cli, ["prometheus", "--port", "9090"])
@@ -1,36 +1,15 @@
 """Tests for Reed.co.uk job board scraper."""
 
-import tempfile
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.database import get_session, init_db
 from src.job_scrapers.reed_scraper import ReedScraper
 from src.models import Job
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create Reed scraper with test API key."""
@@ -117,11 +96,11 @@ class TestReedScraper:
         jobs = scraper_no_key._fetch_jobs()
         assert jobs == []
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_fetch_jobs_success(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_REED_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_REED_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs()
@@ -129,7 +108,7 @@ class TestReedScraper:
         assert len(jobs) == 2
         assert jobs[0]["jobTitle"] == "Innovation Lead"
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_fetch_jobs_auth_failure(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 401
@@ -138,7 +117,7 @@ class TestReedScraper:
         jobs = scraper._fetch_jobs()
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_fetch_jobs_rate_limit(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 429
@@ -147,38 +126,38 @@ class TestReedScraper:
         jobs = scraper._fetch_jobs()
         assert len(jobs) == 0
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_fetch_deduplicates_across_terms(self, mock_get, scraper):
         """Jobs returned by multiple search terms are deduplicated."""
         scraper.search_terms = ["innovation lead", "enterprise architect"]
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_REED_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_REED_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs()
         assert len(jobs) == 2  # Not 4, despite two search terms returning same jobs
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_fetch_stops_on_empty_results(self, mock_get, scraper):
         first = MagicMock()
         first.status_code = 200
-        first.json.return_value = SAMPLE_REED_RESPONSE
+        first.content = json.dumps(SAMPLE_REED_RESPONSE).encode()
 
         empty = MagicMock()
         empty.status_code = 200
-        empty.json.return_value = {"results": []}
+        empty.content = json.dumps({"results": []}).encode()
 
         mock_get.side_effect = [first, empty]
         jobs = scraper._fetch_jobs()
         assert len(jobs) == 2
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_scrape_persists_jobs(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_REED_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_REED_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper.scrape(max_retries=1)
@@ -187,11 +166,11 @@ class TestReedScraper:
         saved = scraper.session.query(Job).filter(Job.source == "reed").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.reed_scraper.requests.get")
+    @patch("src.job_scrapers.reed_scraper.requests.Session.get")
     def test_scrape_deduplicates(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_REED_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_REED_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         first = scraper.scrape(max_retries=1)
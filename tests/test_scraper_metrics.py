@@ -1,5 +1,3 @@
-import os
-
 from sqlalchemy import text
 
 from src.database import get_session, init_db
@@ -34,9 +32,9 @@ class DummyScraper(BaseScraper):
         }
 
 
-def test_metrics_recorded(tmp_path):
+def test_metrics_recorded(tmp_path, monkeypatch):
     db_file = tmp_path / "metrics.db"
-    os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_file}")
     init_db()
     session = get_session()
 
@@ -0,0 +1,35 @@
+"""Tests for tech keyword matching in job descriptions."""
+
+from src.job_scrapers.tech_keywords import (
+    ATS_TECH_KEYWORDS,
+    TECH_KEYWORDS,
+    find_keywords,
+)
+
+
+def test_matches_whole_terms_only():
+    """Keywords inside longer words are not reported."""
+    text = "Good JavaScript devs with digital interest in Google revenue"
+    assert find_keywords(text, ATS_TECH_KEYWORDS) == ["javascript"]
+
+
+def test_punctuated_keywords():
+    text = "Required: C#, C++ and .NET on Node.js; CI/CD with Jenkins"
+    found = find_keywords(text, TECH_KEYWORDS)
+    assert {"c#", "c++", ".net", "node", "ci/cd", "jenkins"} <= set(found)
+
+
+def test_longest_keyword_wins_and_order_follows_list():
+    text = "SQL Server, Azure and Python"
+    assert find_keywords(text, TECH_KEYWORDS) == ["python", "azure", "sql server"]
+
+
+def test_empty_description():
+    assert find_keywords("", TECH_KEYWORDS) == []
+
+
+def test_short_descriptions():
+    """Text as short as the shortest keyword is still scanned."""
+    assert find_keywords(None, TECH_KEYWORDS) == []
+    assert find_keywords("x", TECH_KEYWORDS) == []
+    assert find_keywords("Go", TECH_KEYWORDS) == ["go"]
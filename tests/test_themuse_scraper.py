@@ -1,36 +1,16 @@
 """Tests for The Muse job board scraper."""
 
-import tempfile
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from src.database import get_session, init_db
 from src.job_scrapers.themuse_scraper import TheMuseScraper
 from src.models import Job
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = f"sqlite:///{tmpdir}/test.db"
-        import os
-
-        os.environ["DATABASE_URL"] = db_path
-        init_db()
-        yield db_path
-
-
-@pytest.fixture
-def session(temp_db):
-    """Get database session."""
-    session = get_session()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def scraper(session):
     """Create The Muse scraper."""
@@ -139,11 +119,11 @@ class TestTheMuseScraper:
         assert TheMuseScraper._strip_html("") == ""
         assert TheMuseScraper._strip_html("plain text") == "plain text"
 
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
+    @patch("src.job_scrapers.themuse_scraper.requests.Session.get")
     def test_fetch_jobs_success(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_MUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_MUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper._fetch_jobs(max_pages=1)
@@ -151,34 +131,36 @@ class TestTheMuseScraper:
         assert len(jobs) == 2
         assert jobs[0]["name"] == "Senior Software Engineer"
 
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
-    def test_fetch_jobs_api_error(self, mock_get, scraper):
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
-
-        jobs = scraper._fetch_jobs()
-        assert len(jobs) == 0
-
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
-    def test_fetch_jobs_network_error(self, mock_get, scraper):
-        import requests
-
-        mock_get.side_effect = requests.RequestException("Connection timeout")
-
-        jobs = scraper._fetch_jobs()
-        assert len(jobs) == 0
-
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            MagicMock(status_code=500),
+            requests.RequestException("Connection timeout"),
+        ],
+        ids=["api_error", "network_error"],
+    )
+    def test_fetch_jobs_failure_returns_empty(self, scraper, outcome):
+        """Server errors and network errors yield no jobs."""
+        with patch("src.job_scrapers.themuse_scraper.requests.Session.get") as mock_get:
+            if isinstance(outcome, Exception):
+                mock_get.side_effect = outcome
+            else:
+                mock_get.return_value = outcome
+
+            assert scraper._fetch_jobs() == []
+
+    @patch("src.job_scrapers.themuse_scraper.requests.Session.get")
     def test_fetch_jobs_pagination_stops_at_page_count(self, mock_get, scraper):
         """Test pagination respects page_count from API."""
         response = MagicMock()
         response.status_code = 200
-        response.json.return_value = {
-            "page": 0,
-            "page_count": 1,
-            "results": SAMPLE_MUSE_RESPONSE["results"],
-        }
+        response.content = json.dumps(
+            {
+                "page": 0,
+                "page_count": 1,
+                "results": SAMPLE_MUSE_RESPONSE["results"],
+            }
+        ).encode()
         mock_get.return_value = response
 
         jobs = scraper._fetch_jobs(max_pages=5)
@@ -186,11 +168,11 @@ class TestTheMuseScraper:
         assert len(jobs) == 2
         assert mock_get.call_count == 1  # Only 1 page fetched
 
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
+    @patch("src.job_scrapers.themuse_scraper.requests.Session.get")
     def test_scrape_persists_jobs(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_MUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_MUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         jobs = scraper.scrape(max_retries=1, max_pages=1)
@@ -199,11 +181,11 @@ class TestTheMuseScraper:
         saved = scraper.session.query(Job).filter(Job.source == "themuse").all()
         assert len(saved) == 2
 
-    @patch("src.job_scrapers.themuse_scraper.requests.get")
+    @patch("src.job_scrapers.themuse_scraper.requests.Session.get")
     def test_scrape_deduplicates(self, mock_get, scraper):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_MUSE_RESPONSE
+        mock_response.content = json.dumps(SAMPLE_MUSE_RESPONSE).encode()
         mock_get.return_value = mock_response
 
         first = scraper.scrape(max_retries=1, max_pages=1)
@@ -1,5 +1,6 @@
 """Unit tests for ThoughtworksScraper."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -46,7 +47,7 @@ def test_source_name(scraper):
 
 def test_fetch_jobs_calls_api(scraper):
     mock_response = MagicMock()
-    mock_response.json.return_value = {"jobs": [SAMPLE_JOB]}
+    mock_response.content = json.dumps({"jobs": [SAMPLE_JOB]}).encode()
 
     with patch("requests.get", return_value=mock_response) as mock_get:
         jobs = scraper._fetch_jobs()
@@ -57,7 +58,7 @@ def test_fetch_jobs_calls_api(scraper):
 
 def test_fetch_jobs_returns_empty_on_no_jobs(scraper):
     mock_response = MagicMock()
-    mock_response.json.return_value = {}
+    mock_response.content = json.dumps({}).encode()
 
     with patch("requests.get", return_value=mock_response):
         jobs = scraper._fetch_jobs()
@@ -1,30 +1,27 @@
 """Tests for user profile module."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from src.database import get_session, init_db
 from src.user_profile import UserProfile
 
+# A second, minimal CV for tests that need more than one user
+_SECOND_CV = b"""# Jane Doe
+
+## Contact Information
+- **Title**: Product Manager
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        import os
+---
 
-        db_path = os.path.join(temp_dir, "test.db")
-        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
-        yield db_path
-        if os.path.exists(db_path):
-            os.remove(db_path)
+## Professional Experience
 
+### Company | PM
+"""
 
-@pytest.fixture
-def sample_cv_file(tmp_path):
-    """Create a sample CV file for testing."""
+
+@pytest.fixture(scope="module")
+def sample_cv_file(tmp_path_factory):
+    """Create a sample CV file, shared by the tests in this module."""
     cv_content = """# John Doe
 
 ## Contact Information
@@ -72,7 +69,7 @@ Experienced software engineer with 5 years of experience building scalable syste
 - English (Fluent)
 - Spanish (Conversational)
 """
-    cv_file = tmp_path / "sample_cv.md"
+    cv_file = tmp_path_factory.mktemp("cv") / "sample_cv.md"
     cv_file.write_text(cv_content)
     return str(cv_file)
 
@@ -196,26 +193,15 @@ def test_get_nonexistent_user(temp_db):
     session.close()
 
 
-def test_list_users(temp_db, sample_cv_file):
+def test_list_users(temp_db, sample_cv_file, tmp_path):
     """Test listing all users."""
     init_db()
     session = get_session()
     profile_mgr = UserProfile(session)
 
-    # Create multiple users by modifying CV
-    cv_content = """# Jane Doe
-
-## Contact Information
-- **Title**: Product Manager
-
----
-
-## Professional Experience
-
-### Company | PM
-"""
-    temp_cv2 = Path(sample_cv_file).parent / "cv2.md"
-    temp_cv2.write_text(cv_content)
+    # Create multiple users from two CVs
+    temp_cv2 = tmp_path / "cv2.md"
+    temp_cv2.write_bytes(_SECOND_CV)
 
     profile_mgr.create_profile_from_cv(sample_cv_file)
     profile_mgr.create_profile_from_cv(str(temp_cv2))
@@ -228,30 +214,23 @@ def test_list_users(temp_db, sample_cv_file):
     session.close()
 
 
-def test_create_profile_missing_cv_file(temp_db):
+def test_create_profile_missing_cv_file(raw_session):
     """Test error handling for missing CV file."""
-    init_db()
-    session = get_session()
-    profile_mgr = UserProfile(session)
+    # The CV is rejected before the session is touched, so no database needed
+    profile_mgr = UserProfile(raw_session)
 
-    # parse_cv_file returns empty dict for missing files, which raises ValueError
-    with pytest.raises(ValueError):
+    # A missing CV file is reported as ValueError, like an unparseable one
+    with pytest.raises(ValueError, match="CV file not found"):
         profile_mgr.create_profile_from_cv("/nonexistent/cv.md")
 
-    session.close()
-
 
-def test_create_profile_invalid_cv(temp_db, tmp_path):
+def test_create_profile_invalid_cv(raw_session, tmp_path):
     """Test error handling for invalid CV file."""
-    init_db()
-    session = get_session()
-    profile_mgr = UserProfile(session)
+    profile_mgr = UserProfile(raw_session)
 
     # Create invalid CV (no name)
     invalid_cv = tmp_path / "invalid_cv.md"
     invalid_cv.write_text("## Some Section\nNo name header")
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Failed to parse CV"):
         profile_mgr.create_profile_from_cv(str(invalid_cv))
-
-    session.close()
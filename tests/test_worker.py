@@ -25,6 +25,7 @@ def test_scrape_job_with_mock():
 
     assert mock_scraper_cls.called
     assert mock_instance.scrape.called
+    mock_instance.close.assert_called_once()
 
 
 def test_match_job_with_mock():
@@ -66,7 +67,7 @@ def test_scrape_job_unknown_source_logs_warning():
 
 
 def test_scrape_job_exception_is_caught():
-    """Exceptions from scraper are caught, session still closed."""
+    """Exceptions from scraper are caught, scraper and session still closed."""
     mock_scraper_cls = MagicMock()
     mock_instance = MagicMock()
     mock_instance.scrape.side_effect = RuntimeError("scraper blew up")
@@ -79,6 +80,7 @@ def test_scrape_job_exception_is_caught():
             _scrape_job("greenhouse")  # must not propagate
 
         mock_session.close.assert_called_once()
+    mock_instance.close.assert_called_once()
 
 
 def test_match_job_specific_user(monkeypatch, tmp_path):
@@ -172,8 +174,8 @@ def test_worker_cli_command():
     runner = CliRunner()
 
     # Mock the worker to avoid actually starting it
-    with patch("src.cli.start_worker") as mock_start:
-        with patch("src.cli.setup_signal_handlers"):
+    with patch("src.worker.start_worker") as mock_start:
+        with patch("src.worker.setup_signal_handlers"):
             mock_scheduler = MagicMock()
             mock_start.return_value = mock_scheduler
 